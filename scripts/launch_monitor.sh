@@ -13,13 +13,15 @@ script_dir=$(
 
 PLUGIN_DIR="$(dirname "$script_dir")"
 
-REFRESH_RATE=$(get_option "@tmux_resource_monitor_refresh_rate" "2.0")
-WIDTH=$(get_option "@tmux_resource_monitor_width" "80%")
-HEIGHT=$(get_option "@tmux_resource_monitor_height" "80%")
-
-SESSION_NAME=$(tmux display-message -p '#{session_name}')
-WINDOW_NAME=$(tmux display-message -p '#{window_name}')
-CWD=$(tmux display-message -p '#{pane_current_path}')
+# Read the options and pane details with a single tmux call; fields are
+# separated by the ASCII unit separator so empty values are kept
+sep=$'\037'
+IFS="$sep" read -r REFRESH_RATE WIDTH HEIGHT SESSION_NAME WINDOW_NAME CWD <<<"$(
+	tmux display-message -p "#{@tmux_resource_monitor_refresh_rate}$sep#{@tmux_resource_monitor_width}$sep#{@tmux_resource_monitor_height}$sep#{session_name}$sep#{window_name}$sep#{pane_current_path}"
+)"
+REFRESH_RATE=${REFRESH_RATE:-2.0}
+WIDTH=${WIDTH:-80%}
+HEIGHT=${HEIGHT:-80%}
 
 ARGS="$SESSION_NAME"
 ARGS="$ARGS -w $WINDOW_NAME"
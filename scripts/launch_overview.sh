@@ -13,10 +13,14 @@ script_dir=$(
 
 PLUGIN_DIR="$(dirname "$script_dir")"
 
-REFRESH_RATE=$(get_option "@tmux_resource_monitor_refresh_rate" "2.0")
-WIDTH=$(get_option "@tmux_resource_monitor_width" "80%")
-HEIGHT=$(get_option "@tmux_resource_monitor_height" "80%")
-
-CWD=$(tmux display-message -p '#{pane_current_path}')
+# Read the options and pane details with a single tmux call; fields are
+# separated by the ASCII unit separator so empty values are kept
+sep=$'\037'
+IFS="$sep" read -r REFRESH_RATE WIDTH HEIGHT CWD <<<"$(
+	tmux display-message -p "#{@tmux_resource_monitor_refresh_rate}$sep#{@tmux_resource_monitor_width}$sep#{@tmux_resource_monitor_height}$sep#{pane_current_path}"
+)"
+REFRESH_RATE=${REFRESH_RATE:-2.0}
+WIDTH=${WIDTH:-80%}
+HEIGHT=${HEIGHT:-80%}
 
 tmux display-popup -E -w "$WIDTH" -h "$HEIGHT" -d "$CWD" python3 "$PLUGIN_DIR/tmux_overview.py" -r $REFRESH_RATE
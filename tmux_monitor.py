@@ -5,17 +5,258 @@ tmux-resource-monitor-curses.py - Lightweight and simple tmux resource monitor u
 
 import argparse
 import curses
+import functools
+import operator
 import os
+import re
+import select
+import shutil
 import signal
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional, Tuple
 
 import psutil
 
+# Seconds between data refreshes unless set on the command line or in tmux
+DEFAULT_REFRESH_RATE = 2.0
+
+# CPU percentages need time between two samples to mean anything, so faster
+# refresh rates are raised to this (seconds)
+MIN_SAMPLE_INTERVAL = 0.2
+
+# Refresh interval backoff applied while the monitored data stays unchanged
+REFRESH_BACKOFF = 1.5
+MAX_REFRESH_INTERVAL = 10.0
+
+# Redraws per second at most, unless set in tmux; bursts of input or data
+# changes within one frame are drawn together
+DEFAULT_MAX_FPS = 20
+
+# How long curses waits after ESC for the rest of an escape sequence; the
+# ncurses default of 1s makes a plain ESC feel unresponsive
+ESCAPE_DELAY_MS = 25
+
+# Keys that delete the last typed digit; terminals send DEL or ^H
+BACKSPACE_KEYS = frozenset((curses.KEY_BACKSPACE, 127, 8))
+
+# Longest signal number that can be typed; NSIG is one past the highest
+MAX_SIGNAL_DIGITS = len(str(signal.NSIG - 1))
+
+# Help screen text; the first line is drawn centered as the title
+HELP_LINES = (
+    "Tmux Resource Monitor - Keyboard Controls",
+    "",
+    "Navigation:",
+    "  o or O                Go back to overview of all sessions",
+    "  <- -> or h l          Navigate between windows",
+    "  q or Q                Exit the monitor",
+    "  ?                     Show/hide this help screen",
+    "",
+    "Process Browsing (press j or down to start):",
+    "  j/k or up/down        Navigate up/down through processes",
+    "  Alt+h/l or Alt+<- ->  Scroll long command lines horizontally",
+    "  x                     Send SIGTERM (15) to selected process",
+    "  s                     Enter signal number to send custom signal",
+    "  y                     Copy process command to clipboard",
+    "  Y                     Copy process PID to clipboard",
+    "  <- -> or h l          Navigate between windows (works in all modes)",
+    "",
+    "Display:",
+    "  Header                Shows session name and total resource usage",
+    "  Tabs                  Shows available windows (current window is highlighted)",
+    "  Process List          Shows processes in the current window",
+    "  Footer                Shows exit instructions",
+    "",
+    "Features:",
+    "  • Session summary with total resource usage",
+    "  • Interactive window navigation",
+    "  • Process tree visualization for selected window",
+    "  • Process selection and signal sending",
+    "  • Real-time updates",
+    "  • Lightweight curses-based interface",
+    "",
+    "Press any key to return to the monitor...",
+)
+
+# Footer key hints; the overview has a short form for narrow terminals
+SESSION_FOOTER = "Press 'q' to quit, '?' for help"
+OVERVIEW_FOOTER = (
+    "Press 'q' to quit, 'j/k' or up/down to browse, Enter to select session"
+)
+OVERVIEW_FOOTER_SHORT = "q=quit j/k=browse Enter=select"
+
+# Clipboard tools in order of preference (Wayland, then X11)
+CLIPBOARD_COMMANDS = (
+    ["wl-copy"],
+    ["xclip", "-selection", "clipboard"],
+    ["xsel", "--clipboard", "--input"],
+)
+
+# While the monitor's pane is hidden, collection pauses and visibility is
+# re-checked at this interval (seconds)
+PANE_VISIBILITY_INTERVAL = 5.0
+
+# When the control client fails to start or dies, tmux is run directly for this
+# many seconds before reconnecting; after CONTROL_MAX_FAILURES failures in a
+# row without a reply, the control client is not tried again
+CONTROL_RETRY_INTERVAL = 30.0
+CONTROL_MAX_FAILURES = 3
+
+# A childless pane process under IDLE_PANE_CPU percent for this many refreshes
+# is only re-read on every this-many-th refresh until it spawns a child
+IDLE_PANE_CYCLES = 5
+IDLE_PANE_CPU = 1.0
+
+# On free-threaded builds (3.13t+) sessions are collected on parallel threads
+FREE_THREADED = not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Aggregate process stats are read straight from /proc/<pid>/stat on Linux
+PROC_STAT_AVAILABLE = sys.platform.startswith("linux")
+if PROC_STAT_AVAILABLE:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    PAGE_SIZE_KB = os.sysconf("SC_PAGE_SIZE") // 1024
+
+# Processes whose /proc files are kept open between refreshes (two fds each)
+MAX_CACHED_PROC_FILES = 256
+
+
+class ProcStatReader:
+    """Read CPU seconds, RSS (KB) and identity for PIDs from /proc/<pid>/stat{,m}.
+
+    The files are kept open and re-read with os.pread() on later refreshes.
+    An open file keeps referring to the process it was opened for, so once
+    that process exits reads fail instead of returning a reused PID's stats.
+    The descriptor cache is shared by the session workers on free-threaded
+    builds, so it is only touched with the lock held.
+    """
+
+    def __init__(self):
+        self.fds = {}  # pid -> (stat fd, statm fd)
+        self.lock = threading.RLock()
+
+    def read(self, pids):
+        """Return {pid: (cpu_seconds, rss_kb, identity)} for PIDs still running.
+
+        identity is (start time in clock ticks, command name); the name
+        changes when the process execs. Returns None when /proc is not
+        available and psutil has to be used.
+        """
+        if not PROC_STAT_AVAILABLE:
+            return None
+
+        with self.lock:
+            return self.read_locked(pids)
+
+    def read_locked(self, pids):
+        """Read stats for PIDs; the caller must hold the lock."""
+        stats = {}
+        for pid in pids:
+            fds = self.fds.get(pid)
+            cached = fds is not None
+            try:
+                if not cached:
+                    fds = self.open(pid)
+                    cached = pid in self.fds
+                stat_data = os.pread(fds[0], 512, 0)
+                statm_data = os.pread(fds[1], 128, 0)
+                # The command name may contain spaces or parentheses, so fields
+                # are split after the last ")"; fields[0] is field 3 (state)
+                name_end = stat_data.rindex(b")")
+                fields = stat_data[name_end + 2 :].split()
+                utime, stime = int(fields[11]), int(fields[12])
+                start_ticks = int(fields[19])
+                name = stat_data[stat_data.index(b"(") + 1 : name_end]
+                # statm gives the same RSS that psutil's memory_info() reports
+                rss = int(statm_data.split()[1])
+            except (OSError, ValueError, IndexError):
+                if cached:
+                    self.evict(pid)
+                continue
+            finally:
+                # Files opened past the cache limit are only used once
+                if fds is not None and not cached:
+                    self.close_fds(fds)
+            stats[pid] = (
+                (utime + stime) / CLOCK_TICKS,
+                rss * PAGE_SIZE_KB,
+                (start_ticks, name.decode("utf-8", "replace")),
+            )
+        return stats
+
+    def ppids(self):
+        """Return {pid: ppid} for every running process from one /proc scan.
+
+        Returns None when /proc is not available and psutil has to be used.
+        """
+        if not PROC_STAT_AVAILABLE:
+            return None
+
+        ppids = {}
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    fd = os.open(f"{entry.path}/stat", os.O_RDONLY)
+                    try:
+                        stat_data = os.read(fd, 512)
+                    finally:
+                        os.close(fd)
+                    # Field 4 (ppid) is the second one after the command name
+                    fields = stat_data[stat_data.rindex(b")") + 2 :].split(None, 2)
+                    ppids[int(entry.name)] = int(fields[1])
+                except (OSError, ValueError, IndexError):
+                    continue  # Exited during the scan
+        return ppids
+
+    def open(self, pid):
+        """Open a PID's stat files, caching them while there is room.
+
+        The caller must hold the lock.
+        """
+        stat_fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
+        try:
+            statm_fd = os.open(f"/proc/{pid}/statm", os.O_RDONLY)
+        except OSError:
+            os.close(stat_fd)
+            raise
+        if len(self.fds) < MAX_CACHED_PROC_FILES:
+            self.fds[pid] = (stat_fd, statm_fd)
+        return stat_fd, statm_fd
+
+    def close_fds(self, fds):
+        """Close a (stat fd, statm fd) pair."""
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def evict(self, pid):
+        """Close and forget the cached files for a PID."""
+        with self.lock:
+            fds = self.fds.pop(pid, None)
+            if fds is not None:
+                self.close_fds(fds)
+
+    def prune(self, live_pids):
+        """Close cached files for PIDs that are no longer running."""
+        with self.lock:
+            for pid in list(self.fds):
+                if pid not in live_pids:
+                    self.evict(pid)
+
+    def close(self):
+        """Close all cached files."""
+        with self.lock:
+            for pid in list(self.fds):
+                self.evict(pid)
+
 
 @dataclass
 class SessionStats:
@@ -26,6 +267,56 @@ class SessionStats:
     window_count: int
 
 
+class ProcessInfo:
+    """One row of a window's process tree.
+
+    A record is built for every displayed process on every refresh, so it
+    uses __slots__ rather than a per-instance __dict__.
+    """
+
+    __slots__ = (
+        "pid",
+        "cpu",
+        "memory_kb",
+        "command",
+        "depth",
+        "is_last_child",
+        "has_children",
+        "parent_pid",
+        "base_line",
+        "mem_x",
+        "tree_prefix",
+        "truncated_command",
+    )
+
+    def __init__(
+        self,
+        pid: int,
+        cpu: float,
+        memory_kb: int,
+        command: str,
+        depth: int,
+        is_last_child: bool,
+        has_children: bool,
+        parent_pid: Optional[int],
+        base_line: str = "",
+        mem_x: int = 0,
+    ):
+        self.pid = pid
+        self.cpu = cpu
+        self.memory_kb = memory_kb
+        self.command = command
+        self.depth = depth
+        self.is_last_child = is_last_child
+        self.has_children = has_children
+        self.parent_pid = parent_pid
+        self.base_line = base_line  # Formatted PID, CPU and MEM columns
+        self.mem_x = mem_x  # Where the MEM column starts in base_line
+        self.tree_prefix = ""  # Filled in once the window's tree is complete
+        # (width, text) of the command truncated for that width
+        self.truncated_command: Optional[Tuple[int, str]] = None
+
+
 @dataclass
 class WindowStats:
     name: str
@@ -34,22 +325,168 @@ class WindowStats:
     ram_total: int  # in KB
     process_count: int
     pane_pids: List[int]
-    processes: List[dict]  # Store process info for display
+    processes: List[ProcessInfo]  # Store process info for display
+
+
+class TmuxControlClient:
+    """Persistent tmux control-mode connection for running tmux commands.
+
+    Sending a command over the control-mode pipe avoids spawning a new tmux
+    process for every query. command() returns None when the connection is
+    unavailable so callers can fall back to running tmux directly.
+    """
+
+    def __init__(self):
+        self.proc = None
+        self.lock = threading.Lock()
+        self.failures = 0  # Failed connections since the last reply
+        self.retry_time = float("-inf")  # No reconnect attempt before this
+
+    def connect(self):
+        """Attach a read-only control client that does not affect window sizes."""
+        try:
+            self.proc = subprocess.Popen(
+                [
+                    "tmux",
+                    "-C",
+                    "attach",
+                    "-f",
+                    "read-only,ignore-size,no-output",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except OSError:
+            self.proc = None
+
+    def command(self, command):
+        """Run a tmux command and return its output lines, or None on failure."""
+        with self.lock:
+            if self.proc is None or self.proc.poll() is not None:
+                if time.monotonic() < self.retry_time:
+                    return None
+                self.connect()
+                if self.proc is None:
+                    self.fail_locked()
+                    return None
+            try:
+                self.proc.stdin.write(command + "\n")
+                self.proc.stdin.flush()
+
+                # Replies to our commands are framed by %begin/%end (or %error)
+                # with flags 1; notifications arrive outside these blocks
+                lines = []
+                in_reply = False
+                while True:
+                    line = self.proc.stdout.readline()
+                    if not line:
+                        self.fail_locked()
+                        return None
+                    line = line.rstrip("\n")
+                    # Only guard lines are split; output lines are kept as is
+                    if not in_reply:
+                        if line.startswith("%begin "):
+                            parts = line.split(" ")
+                            if parts[-1] == "1":
+                                in_reply = True
+                                reply_id = parts[1:]
+                        continue
+                    if line.startswith(("%end ", "%error ")):
+                        parts = line.split(" ")
+                        if parts[1:] == reply_id:
+                            self.failures = 0
+                            return lines if parts[0] == "%end" else None
+                    lines.append(line)
+            except (OSError, ValueError):
+                self.fail_locked()
+                return None
+
+    def fail_locked(self):
+        """Drop a broken connection and hold off reconnecting.
+
+        Without this, a tmux that cannot run the control client would have
+        one spawned for every query, on top of the fallback. The caller must
+        hold the lock.
+        """
+        self.close_locked()
+        self.failures += 1
+        if self.failures >= CONTROL_MAX_FAILURES:
+            self.retry_time = float("inf")
+        else:
+            self.retry_time = time.monotonic() + CONTROL_RETRY_INTERVAL
+
+    def close_locked(self):
+        """Terminate the control client; the caller must hold the lock."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self.proc.kill()
+        self.proc = None
+
+    def close(self):
+        """Detach the control client."""
+        with self.lock:
+            self.close_locked()
 
 
 class TmuxResourceMonitor:
-    def __init__(self, session_name, window_filter=None, refresh_rate=2.0):
+    def __init__(
+        self,
+        session_name,
+        window_filter=None,
+        refresh_rate=DEFAULT_REFRESH_RATE,
+        max_fps=DEFAULT_MAX_FPS,
+    ):
         self.session_name = session_name
         self.window_filter = window_filter
-        self.refresh_rate = refresh_rate
+        self.refresh_rate = max(refresh_rate, MIN_SAMPLE_INTERVAL)
+        self.frame_interval = 1.0 / max_fps
+        self.last_draw_time = float("-inf")
+        self.current_refresh_interval = self.refresh_rate
+        self.last_data_signature = None
+        self.overview_snapshot = None  # Values drawn by the last overview frame
         self.total_ram_mb = psutil.virtual_memory().total // (1024 * 1024)
+        # Multiplier turning an RSS in KB into a percentage of total RAM
+        self.ram_percent_scale = (
+            100 / (self.total_ram_mb * 1024) if self.total_ram_mb > 0 else 0
+        )
+        # The first cpu_percent() call in a thread only sets psutil's baseline
+        # for that thread and returns 0.0, so make it here; run_curses waits
+        # out MIN_SAMPLE_INTERVAL from this point before its first collection
+        psutil.cpu_percent()
+        self.cpu_primed_at = time.monotonic()
         self.current_tab = 0
         self.windows_data = []
         self.running = True
         self.stdscr = None
         self.colors_initialized = False
+        # Row attributes, combined once in init_colors instead of per row
+        self.usage_colors = (0, 0, 0)  # (high, medium, low)
+        self.normal_color = 0
+        self.selected_color = 0  # Selected process row
+        self.selected_session_color = 0
+        self.tree_colors = (0, 0)  # (normal, selected)
+        self.footer_color = 0
+        self.title_color = 0  # Titles, column headers and prompts
+        self.separator_color = 0  # Separator lines and delimiters
+        self.label_color = 0  # Summary labels and tab names
+        self.value_color = 0  # Summary counts
+        self.colon_color = 0
+        self.heading_color = 0  # "Windows" and "Window" headings
+        self.session_label_color = 0
+        self.current_tab_color = 0
+        self.window_name_color = 0
+        self.window_value_color = 0
+        self.total_colors = (0, 0, 0, 0)  # (high, medium, low, idle)
         self.show_help = False
         self.process_browsing_active = False
+        self.input_since_refresh = False  # Set by keypresses, cleared per collection
         self.selected_process_index = 0
         self.horizontal_scroll_offset = 0
         self.input_mode = None
@@ -64,80 +501,379 @@ class TmuxResourceMonitor:
         self.tmux_cpu_percent = 0.0
         self.tmux_memory_mb = 0
         self.tmux_memory_percent = 0.0
+        self.tmux_process_count = 0
+        self.tmux_window_count = 0
+        self.session_cpu_total = 0.0  # Totals across windows_data
+        self.session_ram_total = 0
+        self.session_process_count = 0
         self.cpu_needs_warmup = True
-        self.cpu_warmup_done = False
-        self.last_cpu_measurements = {}  # pid -> (timestamp, cpu_times)
-        self.pane_pid_cache = {}  # Cache for pane PIDs: key -> (timestamp, pids)
+        self.cpu_warmup_done = threading.Event()
+        self.window_children_map = {}  # Children map of the last window pass
+        self.last_cpu_measurements = {}  # pid -> (timestamp, cpu_seconds)
+        self.cpu_percent_cache = {}  # pid -> CPU percent for the current pass
+        # Guards the two dicts above; grouped sessions share PIDs, so parallel
+        # session workers can measure the same process
+        self.cpu_lock = threading.Lock()
+        self.proc_cache = {}  # pid -> psutil.Process, reused across refreshes
+        self.cmdline_cache = {}  # pid -> ((start time, name), command string)
+        self.idle_panes = {}  # pane pid -> (quiet refresh count, process list)
+        self.proc_stats = ProcStatReader()
+        self.data_lock = threading.Lock()  # Guards data published by the collector
+        self.refresh_requested = threading.Event()
+        # Wakes the collector early, to serve a request or re-plan its sleep
+        self.collector_wakeup = threading.Event()
+        self.data_ready = True
+        self.needs_redraw = True  # Set by new data or input, cleared once drawn
+        self.screen_size = (0, 0)  # (height, width), updated on resize
+        self.resized = False  # Set by the SIGWINCH handler
+        # Self-pipe that wakes the main loop for redraws and signals
+        self.wakeup_read, self.wakeup_write = os.pipe()
+        os.set_blocking(self.wakeup_read, False)
+        os.set_blocking(self.wakeup_write, False)
+        self.tmux_snapshot = None  # session -> {window_index: (name, pane_pids)}
+        self.tmux_snapshot_time = float("-inf")
+        self.tmux_control = TmuxControlClient()
+        self.collect_pool = (
+            ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+            if FREE_THREADED
+            else None
+        )
+        self.tmux_pane = os.environ.get("TMUX_PANE")  # Pane hosting the monitor
+        self.pane_visible = True
+        self.pane_visibility_time = float("-inf")
+        self.clipboard_commands = [
+            command for command in CLIPBOARD_COMMANDS if shutil.which(command[0])
+        ]
+        # One worker, so quick repeated copies reach the clipboard in order
+        self.clipboard_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Key handlers for normal and process browsing mode
+        self.key_handlers = {}
+        for keys, handler in (
+            ((ord("q"), ord("Q"), 3), self.quit),  # 3 is Ctrl+C
+            ((ord("?"),), self.toggle_help),
+            ((ord("o"), ord("O"), 27), self.return_to_overview),  # 27 is ESC
+            ((curses.KEY_LEFT, ord("h"), ord("H")), self.prev_tab),
+            ((curses.KEY_RIGHT, ord("l"), ord("L")), self.next_tab),
+            ((ord("j"), curses.KEY_DOWN), self.select_next),
+            ((ord("k"), curses.KEY_UP), self.select_previous),
+            ((ord("y"),), self.copy_selected_command),
+            ((ord("Y"),), self.copy_selected_pid),
+            ((ord("s"), ord("S")), self.start_signal_input),
+            ((10, 13), self.open_selected_session),  # Enter
+            ((ord("x"), ord("X")), self.terminate_selected),
+        ):
+            for key in keys:
+                self.key_handlers[key] = handler
 
     def warmup_cpu_async(self):
         """Start async CPU warmup in background to establish baseline."""
 
         def do_warmup():
             time.sleep(0.1)
+            # Walk the first pass's map; building a new one would prune caches
+            # the collector may be using by now
+            children_map = self.window_children_map
             for window in self.windows_data:
                 for pid in window.pane_pids:
-                    try:
-                        proc = psutil.Process(pid)
-                        times = proc.cpu_times()
-                        self.last_cpu_measurements[pid] = (time.time(), times)
-                        for child in proc.children(recursive=True):
-                            try:
-                                child_times = child.cpu_times()
-                                self.last_cpu_measurements[child.pid] = (
-                                    time.time(),
-                                    child_times,
-                                )
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        if pid in self.last_cpu_measurements:
-                            del self.last_cpu_measurements[pid]
-            self.cpu_warmup_done = True
+                    for p in [pid] + self._descendants(pid, children_map):
+                        try:
+                            times = self._proc(p).cpu_times()
+                            baseline = (time.monotonic(), times.user + times.system)
+                        except (psutil.NoSuchProcess, psutil.AccessDenied):
+                            baseline = None
+                        with self.cpu_lock:
+                            if baseline is None:
+                                self.last_cpu_measurements.pop(p, None)
+                            else:
+                                self.last_cpu_measurements[p] = baseline
+            self.cpu_warmup_done.set()
 
         thread = threading.Thread(target=do_warmup, daemon=True)
         thread.start()
 
-    def _get_cached_pane_pids(self, window_index):
-        """Get pane PIDs with caching to reduce subprocess calls."""
-        current_time = time.time()
-        cache_key = f"{self.session_name}:{window_index}"
+    def request_refresh(self):
+        """Ask the collector thread for fresh data for the current mode."""
+        self.data_ready = False
+        self.refresh_requested.set()
+        self.collector_wakeup.set()
 
-        if cache_key in self.pane_pid_cache:
-            cached_time, cached_pids = self.pane_pid_cache[cache_key]
-            if current_time - cached_time < 0.5:
-                return cached_pids
+    def request_redraw(self):
+        """Mark the screen stale and wake the main loop to redraw it."""
+        self.needs_redraw = True
+        try:
+            os.write(self.wakeup_write, b"\0")
+        except BlockingIOError:
+            pass  # The pipe is full, so a wakeup is already pending
+
+    def wait_for_event(self):
+        """Block until a key is pending, a redraw is requested or a signal arrives.
+
+        Nothing runs while the monitor is idle: the collector and the SIGWINCH
+        handler write to the wakeup pipe instead of the loop polling for work.
+        """
+        timeout = None
+        if self.needs_redraw and self.pane_visible:
+            # Wait out the rest of the frame, picking up input meanwhile
+            timeout = max(
+                0, self.last_draw_time + self.frame_interval - time.monotonic()
+            )
+        ready, _, _ = select.select([sys.stdin, self.wakeup_read], [], [], timeout)
+        if self.wakeup_read in ready:
+            try:
+                os.read(self.wakeup_read, 4096)
+            except BlockingIOError:
+                pass
 
-        pids = self.get_pane_pids(window_index)
-        self.pane_pid_cache[cache_key] = (current_time, pids)
-        return pids
+    def handle_resize_signal(self, signum, frame):
+        """Note a terminal resize; the main loop applies it after waking."""
+        self.resized = True
 
-    def get_cpu_percent(self, pid, update_baseline=False):
-        """Get CPU percent using cpu_times() for accurate measurements."""
+    def apply_resize(self, stdscr):
+        """Resize curses to the terminal's new size and schedule a redraw."""
+        self.resized = False
         try:
+            size = os.get_terminal_size(sys.__stdout__.fileno())
+            curses.resizeterm(size.lines, size.columns)
+        except (OSError, curses.error):
+            pass
+        self.screen_size = stdscr.getmaxyx()
+        self.needs_redraw = True
+        # Zooming or unzooming the pane resizes it, so this is a cheap moment
+        # to notice it being covered or uncovered
+        self.recheck_pane_visibility()
+
+    def recheck_pane_visibility(self):
+        """Make the collector query the pane's visibility when it next wakes."""
+        self.pane_visibility_time = float("-inf")
+        self.collector_wakeup.set()
+
+    def collector_loop(self):
+        """Collect data in the background so input and rendering never block."""
+        # psutil keeps the system CPU baseline per thread, so set this one's;
+        # the first timed pass is at least MIN_SAMPLE_INTERVAL away
+        psutil.cpu_percent()
+        last_refresh = time.monotonic()
+        paused = False
+        while self.running:
+            timeout = last_refresh + self.current_refresh_interval - time.monotonic()
+            if paused:
+                # Only a keypress or an explicit request can lift the pause
+                timeout = None
+            elif not self.pane_visible:
+                timeout = PANE_VISIBILITY_INTERVAL
+            else:
+                timeout = max(0, timeout)
+            self.collector_wakeup.wait(timeout)
+            self.collector_wakeup.clear()
+            if not self.running:
+                break
+            requested = self.refresh_requested.is_set()
+            held = (
+                not requested
+                and not self.show_overview
+                and (
+                    self.input_mode
+                    or (self.process_browsing_active and not self.input_since_refresh)
+                )
+            )
+            paused = False
+            if (
+                not requested
+                and not held
+                and self.pane_visible
+                and time.monotonic() < last_refresh + self.current_refresh_interval
+            ):
+                # Woken early, e.g. by input resetting a backed-off interval, so
+                # sleep again until the recomputed deadline
+                continue
+            if not requested and not self.update_pane_visibility():
+                # Nobody can see the pane, so there is nothing to collect for
+                continue
+            if held:
+                # Keep the process list stable while a signal number is typed,
+                # and while a selected process is left untouched
+                paused = True
+                continue
+
+            self.refresh_requested.clear()
+            self.input_since_refresh = False
+            # Intervals run from the start of a collection so its cost adds no drift
+            last_refresh = time.monotonic()
+            try:
+                if self.show_overview:
+                    changed = self.collect_system_stats()
+                else:
+                    self.collect_window_data()
+                    changed = True
+            except Exception:
+                # Keep showing the last data; the next refresh tries again
+                continue
+            was_ready = self.data_ready
+            # A mode switch during collection needs another pass before drawing
+            self.data_ready = not self.refresh_requested.is_set()
+            if changed or not was_ready:
+                self.request_redraw()
+
+    def update_pane_visibility(self):
+        """Check whether the pane running the monitor is currently on screen.
+
+        The pane is hidden when its window is not the active one, or when
+        another pane in the window is zoomed. The answer is cached for
+        PANE_VISIBILITY_INTERVAL seconds, and dropped on a resize or on a
+        keypress while hidden. Switching windows sends the pane nothing, so
+        a hidden pane coming back into view that way is noticed up to that
+        interval late.
+        """
+        current_time = time.monotonic()
+        if (
+            self.tmux_pane is None
+            or current_time - self.pane_visibility_time < PANE_VISIBILITY_INTERVAL
+        ):
+            return self.pane_visible
+
+        lines = self.tmux_output(
+            [
+                "display-message",
+                "-p",
+                "-t",
+                self.tmux_pane,
+                "#{window_active}#{pane_active}#{window_zoomed_flag}",
+            ]
+        )
+        was_visible = self.pane_visible
+        if lines and len(lines[0]) == 3:
+            window_active, pane_active, zoomed = lines[0]
+            self.pane_visible = window_active == "1" and (
+                pane_active == "1" or zoomed == "0"
+            )
+        else:
+            self.pane_visible = True
+
+        self.pane_visibility_time = current_time
+        if self.pane_visible and not was_visible:
+            self.request_redraw()
+        return self.pane_visible
+
+    def start_collector(self):
+        """Start the background data collector thread."""
+        thread = threading.Thread(target=self.collector_loop, daemon=True)
+        thread.start()
+
+    def tmux_output(self, args):
+        """Run a tmux command and return its output lines.
+
+        The control-mode connection is used when available; otherwise tmux is
+        run directly. Returns an empty list if the command fails.
+        """
+        if not any("'" in arg for arg in args):
+            lines = self.tmux_control.command(" ".join(f"'{arg}'" for arg in args))
+            if lines is not None:
+                return lines
+        try:
+            # Descriptors Python opens are not inheritable, so none need closing
+            result = subprocess.run(
+                ["tmux"] + args,
+                capture_output=True,
+                text=True,
+                check=True,
+                close_fds=False,
+            )
+            return result.stdout.splitlines()
+        except subprocess.CalledProcessError:
+            return []
+
+    def _snapshot_tmux(self):
+        """Get all sessions, windows and pane PIDs with a single tmux call.
+
+        The snapshot is cached briefly so every lookup made during one refresh
+        shares the same tmux query.
+        """
+        current_time = time.monotonic()
+        if (
+            self.tmux_snapshot is not None
+            and current_time - self.tmux_snapshot_time < 0.5
+        ):
+            return self.tmux_snapshot
+
+        snapshot = {}
+        lines = self.tmux_output(
+            [
+                "list-panes",
+                "-a",
+                "-F",
+                "#{session_name}\t#{window_index}\t#{window_name}\t#{pane_pid}",
+            ]
+        )
+        for line in lines:
+            parts = line.split("\t", 3)
+            if len(parts) != 4:
+                continue
+            session_name, window_index, window_name, pane_pid = parts
+            try:
+                window_index = int(window_index)
+                pane_pid = int(pane_pid)
+            except ValueError:
+                continue
+            windows = snapshot.setdefault(session_name, {})
+            windows.setdefault(window_index, (window_name, []))[1].append(pane_pid)
+
+        self.tmux_snapshot = snapshot
+        self.tmux_snapshot_time = current_time
+        return snapshot
+
+    def _proc(self, pid):
+        """Get a cached psutil.Process for a PID.
+
+        Entries are not checked on lookup: is_running() builds a new Process
+        itself. build_children_map() drops exited PIDs on every pass, and
+        psutil refuses to signal a Process whose PID was reused.
+        """
+        proc = self.proc_cache.get(pid)
+        if proc is None:
             proc = psutil.Process(pid)
-            current_times = proc.cpu_times()
-            current_time = time.time()
+            self.proc_cache[pid] = proc
+        return proc
+
+    def get_cpu_percent(self, pid, proc=None, cpu_seconds=None):
+        """Get CPU percent using cpu_times() for accurate measurements.
+
+        Each PID is measured once per collection pass; later calls in the same
+        pass reuse that result, and every measurement becomes the baseline for
+        the next pass. cpu_seconds can be passed when it was already read.
+        """
+        with self.cpu_lock:
+            return self.get_cpu_percent_locked(pid, proc, cpu_seconds)
+
+    def get_cpu_percent_locked(self, pid, proc, cpu_seconds):
+        """Measure a PID's CPU percent; the caller must hold cpu_lock."""
+        if pid in self.cpu_percent_cache:
+            return self.cpu_percent_cache[pid]
+
+        percent = 0.0
+        try:
+            if cpu_seconds is None:
+                if proc is None:
+                    proc = self._proc(pid)
+                current_times = proc.cpu_times()
+                cpu_seconds = current_times.user + current_times.system
+            current_time = time.monotonic()
 
             if pid in self.last_cpu_measurements:
-                last_time, last_times = self.last_cpu_measurements[pid]
+                last_time, last_cpu = self.last_cpu_measurements[pid]
                 elapsed = current_time - last_time
 
                 if elapsed > 0.1:
-                    last_cpu = last_times.user + last_times.system
-                    current_cpu = current_times.user + current_times.system
-                    cpu_diff = current_cpu - last_cpu
+                    cpu_diff = cpu_seconds - last_cpu
                     percent = (cpu_diff / elapsed) * 100
-                    if update_baseline:
-                        self.last_cpu_measurements[pid] = (current_time, current_times)
-                    return percent
-                else:
-                    return 0.0
-
-            if update_baseline:
-                self.last_cpu_measurements[pid] = (current_time, current_times)
-            return 0.0
+                    self.last_cpu_measurements[pid] = (current_time, cpu_seconds)
+            else:
+                self.last_cpu_measurements[pid] = (current_time, cpu_seconds)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return 0.0
+            pass
+
+        self.cpu_percent_cache[pid] = percent
+        return percent
 
     def init_colors(self):
         """Initialize color pairs for curses."""
@@ -163,10 +899,44 @@ class TmuxResourceMonitor:
 
             self.colors_initialized = True
 
+        self.usage_colors = (
+            curses.color_pair(4),  # Red
+            curses.color_pair(2),  # Yellow
+            curses.color_pair(1),  # Green
+        )
+        self.normal_color = curses.color_pair(0)
+        self.selected_color = curses.color_pair(8)
+        self.selected_session_color = (
+            curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD
+        )
+        self.tree_colors = (
+            curses.color_pair(9) | curses.A_BOLD,
+            curses.color_pair(10) | curses.A_BOLD,
+        )
+        self.footer_color = curses.color_pair(5)
+        self.title_color = curses.color_pair(3) | curses.A_BOLD
+        self.separator_color = curses.color_pair(5)
+        self.label_color = curses.color_pair(2)
+        self.value_color = curses.color_pair(1)
+        self.colon_color = curses.color_pair(3)
+        self.heading_color = curses.color_pair(6) | curses.A_BOLD
+        self.session_label_color = (
+            curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD
+        )
+        self.current_tab_color = curses.color_pair(2) | curses.A_REVERSE
+        self.window_name_color = curses.color_pair(2) | curses.A_BOLD
+        self.window_value_color = curses.color_pair(1) | curses.A_BOLD
+        self.total_colors = (
+            curses.color_pair(4) | curses.A_BOLD,  # Red
+            curses.color_pair(2) | curses.A_BOLD,  # Yellow
+            curses.color_pair(1) | curses.A_BOLD,  # Green
+            curses.color_pair(0) | curses.A_BOLD,  # Default
+        )
+
     def format_memory(self, rss_kb):
         """Format memory usage with MB/GB and percentage."""
         mb = rss_kb / 1024
-        percent = (rss_kb * 100) / (self.total_ram_mb * 1024)
+        percent = rss_kb * self.ram_percent_scale
 
         if mb >= 1024:
             gb = mb / 1024
@@ -174,357 +944,359 @@ class TmuxResourceMonitor:
         else:
             return f"{mb:6.1f} MB ({percent:5.1f}%)"
 
-    def get_tree_prefix(self, process, processes, index):
-        """Generate tree prefix string for a process."""
-        depth = process["depth"]
-        prefix_parts = []
-
-        # For each level from 0 to depth-1
-        for level in range(depth):
-            if level == 0 and depth == 1:
-                # Top-level process - simple connector
-                if process["is_last_child"]:
-                    prefix_parts.append("└──")
-                else:
-                    prefix_parts.append("├──")
-            elif level == depth - 1:
-                # Current level for nested process - connector
-                if process["is_last_child"]:
-                    prefix_parts.append("└──")
-                else:
-                    prefix_parts.append("├──")
-            else:
-                # Ancestor level - check if ancestor has siblings by looking ahead
-                has_sibling = False
-
-                # Find the ancestor at this level by walking back from current index
-                ancestor_at_level = -1
-                check_idx = index
-                while check_idx > 0 and processes[check_idx]["depth"] > level:
-                    check_idx -= 1
-                if check_idx >= 0 and processes[check_idx]["depth"] == level:
-                    ancestor_at_level = check_idx
-
-                # Check if ancestor has a sibling (process at same depth not in ancestor's subtree)
-                if ancestor_at_level != -1:
-                    # Find where ancestor's subtree ends
-                    subtree_end = ancestor_at_level
-                    for i in range(ancestor_at_level + 1, len(processes)):
-                        if processes[i]["depth"] > level:
-                            subtree_end = i
-                        elif processes[i]["depth"] <= level:
-                            # Reached a process at same or lower level
-                            break
-
-                    # Check if there's a process at this level after the subtree
-                    for i in range(subtree_end + 1, len(processes)):
-                        if processes[i]["depth"] == level:
-                            has_sibling = True
-                            break
-
-                prefix_parts.append("│   " if has_sibling else "    ")
-
-        return "".join(prefix_parts)
+    def assign_tree_prefixes(self, processes):
+        """Store the tree prefix string on each process in a flattened tree."""
+        # Walking backwards, an ancestor level continues ("│") exactly when a
+        # later process sits at that depth, so one pass covers the whole list
+        later_at_depth = []
+        for process in reversed(processes):
+            depth = process.depth
+            prefix_parts = []
+            if depth > 0:
+                for level in range(depth - 1):
+                    continues = level < len(later_at_depth) and later_at_depth[level]
+                    prefix_parts.append("│   " if continues else "    ")
+                prefix_parts.append("└──" if process.is_last_child else "├──")
+            process.tree_prefix = "".join(prefix_parts)
+
+            if depth >= len(later_at_depth):
+                later_at_depth.extend([False] * (depth + 1 - len(later_at_depth)))
+            later_at_depth[depth] = True
+
+    def update_refresh_interval(self, signature):
+        """Back off the refresh interval while the collected data is unchanged."""
+        if signature == self.last_data_signature:
+            self.current_refresh_interval = min(
+                self.current_refresh_interval * REFRESH_BACKOFF,
+                max(self.refresh_rate, MAX_REFRESH_INTERVAL),
+            )
+        else:
+            self.current_refresh_interval = self.refresh_rate
+        self.last_data_signature = signature
+
+    def build_children_map(self):
+        """Map each PID to its child PIDs with a single scan of all processes."""
+        ppids = self.proc_stats.ppids()
+        if ppids is None:
+            ppids = {
+                proc.pid: proc.info["ppid"] for proc in psutil.process_iter(["ppid"])
+            }
+
+        # Children are listed in PID order, as process_iter() yields them
+        children_map = {}
+        for pid in sorted(ppids):
+            ppid = ppids[pid]
+            if ppid is not None:
+                children_map.setdefault(ppid, []).append(pid)
+        live_pids = ppids.keys()
+
+        # Drop cached Process objects, commands and CPU baselines for exited PIDs
+        for pid in list(self.proc_cache):
+            if pid not in live_pids:
+                del self.proc_cache[pid]
+        for pid in list(self.cmdline_cache):
+            if pid not in live_pids:
+                del self.cmdline_cache[pid]
+        for pid in list(self.idle_panes):
+            if pid not in live_pids:
+                del self.idle_panes[pid]
+        for pid in list(self.last_cpu_measurements):
+            if pid not in live_pids:
+                self.last_cpu_measurements.pop(pid, None)
+        self.proc_stats.prune(live_pids)
+
+        return children_map
+
+    def _descendants(self, pid, children_map):
+        """Get all descendant PIDs of a process from a prebuilt children map."""
+        descendants = []
+        seen = {pid}
+        stack = list(children_map.get(pid, ()))
+        while stack:
+            child_pid = stack.pop()
+            if child_pid in seen:
+                continue
+            seen.add(child_pid)
+            descendants.append(child_pid)
+            stack.extend(children_map.get(child_pid, ()))
+        return descendants
 
     def get_tmux_sessions(self):
         """Get list of available tmux sessions."""
-        try:
-            result = subprocess.run(
-                ["tmux", "list-sessions", "-F", "#{session_name}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip().split("\n") if result.stdout.strip() else []
-        except subprocess.CalledProcessError:
-            return []
+        return list(self._snapshot_tmux())
 
     def get_session_window_count(self, session_name):
         """Get the number of windows in a session."""
-        try:
-            result = subprocess.run(
-                ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            windows = result.stdout.strip().split("\n") if result.stdout.strip() else []
-            return len([w for w in windows if w])
-        except subprocess.CalledProcessError:
-            return 0
+        return len(self._snapshot_tmux().get(session_name, {}))
 
     def get_session_pane_pids(self, session_name):
         """Get all pane PIDs for a session."""
         pids = []
-        try:
-            windows_result = subprocess.run(
-                ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            for window_idx in windows_result.stdout.strip().split("\n"):
-                if not window_idx:
-                    continue
-                try:
-                    panes_result = subprocess.run(
-                        [
-                            "tmux",
-                            "list-panes",
-                            "-t",
-                            f"{session_name}:{window_idx}",
-                            "-F",
-                            "#{pane_pid}",
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    for pid_str in panes_result.stdout.strip().split("\n"):
-                        if pid_str.strip():
-                            try:
-                                pids.append(int(pid_str.strip()))
-                            except ValueError:
-                                continue
-                except subprocess.CalledProcessError:
-                    continue
-        except subprocess.CalledProcessError:
-            pass
+        for _, pane_pids in self._snapshot_tmux().get(session_name, {}).values():
+            pids.extend(pane_pids)
         return pids
 
-    def collect_all_sessions_stats(self):
-        """Collect stats for all tmux sessions."""
-        sessions = self.get_tmux_sessions()
-        self.sessions_data = []
-
-        for session_name in sessions:
-            try:
-                pane_pids = self.get_session_pane_pids(session_name)
-                window_count = self.get_session_window_count(session_name)
+    def collect_session_stats(
+        self, session_name, pane_pids, window_count, children_map
+    ):
+        """Collect stats for a single tmux session, or None if that fails."""
+        session_cpu = 0.0
+        session_ram = 0
+        session_process_count = 0
 
-                session_cpu = 0.0
-                session_ram = 0
-                session_process_count = 0
+        try:
+            for pid in pane_pids:
+                pane_cpu, pane_ram, pane_count = self.get_all_process_stats(
+                    pid, children_map
+                )
+                session_cpu += pane_cpu
+                session_ram += pane_ram
+                session_process_count += pane_count
+        except Exception:
+            return None  # Leave this session out rather than the whole pass
+
+        return SessionStats(
+            name=session_name,
+            cpu_total=session_cpu,
+            ram_total=session_ram,
+            process_count=session_process_count,
+            window_count=window_count,
+        )
 
-                for pid in pane_pids:
-                    try:
-                        proc = psutil.Process(pid)
-                        session_cpu += self.get_cpu_percent(pid)
-                        session_ram += proc.memory_info().rss // 1024
-                        session_process_count += 1
-                        for child in proc.children(recursive=True):
-                            try:
-                                session_cpu += self.get_cpu_percent(child.pid)
-                                session_ram += child.memory_info().rss // 1024
-                                session_process_count += 1
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                continue
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+    def collect_all_sessions_stats(self, children_map):
+        """Collect stats for all tmux sessions."""
+        sessions = [
+            (
+                session_name,
+                self.get_session_pane_pids(session_name),
+                self.get_session_window_count(session_name),
+                children_map,
+            )
+            for session_name in self.get_tmux_sessions()
+        ]
 
-                self.sessions_data.append(
-                    SessionStats(
-                        name=session_name,
-                        cpu_total=session_cpu,
-                        ram_total=session_ram,
-                        process_count=session_process_count,
-                        window_count=window_count,
-                    )
+        # Grouped sessions share panes, so workers can read the same PIDs; the
+        # stat reader and the CPU caches take their own locks
+        if self.collect_pool is not None and len(sessions) > 1:
+            sessions_data = list(
+                self.collect_pool.map(
+                    lambda args: self.collect_session_stats(*args), sessions
                 )
-            except Exception:
-                continue
+            )
+        else:
+            sessions_data = [self.collect_session_stats(*args) for args in sessions]
+        sessions_data = [session for session in sessions_data if session is not None]
 
-        self.sessions_data.sort(key=lambda x: x.cpu_total, reverse=True)
+        sessions_data.sort(key=operator.attrgetter("cpu_total"), reverse=True)
+        return sessions_data
 
     def collect_system_stats(self):
-        """Collect system-wide resource usage."""
+        """Collect system-wide resource usage.
+
+        Returns False when every value shown by the overview is unchanged
+        since the previous pass, so the frame does not need redrawing.
+        """
+        self.cpu_percent_cache.clear()
         try:
-            self.system_cpu_percent = psutil.cpu_percent()
+            system_cpu_percent = psutil.cpu_percent()
             mem = psutil.virtual_memory()
-            self.system_memory_percent = mem.percent
-            self.system_memory_mb = mem.used // (1024 * 1024)
+            system_memory_percent = mem.percent
+            system_memory_mb = mem.used // (1024 * 1024)
         except Exception:
-            self.system_cpu_percent = 0.0
-            self.system_memory_percent = 0.0
-            self.system_memory_mb = 0
+            system_cpu_percent = 0.0
+            system_memory_percent = 0.0
+            system_memory_mb = 0
 
-        self.collect_all_sessions_stats()
+        sessions_data = self.collect_all_sessions_stats(self.build_children_map())
 
         total_tmux_cpu = 0.0
         total_tmux_ram = 0
-        for session in self.sessions_data:
+        total_tmux_processes = 0
+        total_tmux_windows = 0
+        for session in sessions_data:
             total_tmux_cpu += session.cpu_total
             total_tmux_ram += session.ram_total
+            total_tmux_processes += session.process_count
+            total_tmux_windows += session.window_count
+
+        # Publish everything at once so a frame never mixes old and new data
+        with self.data_lock:
+            self.system_cpu_percent = system_cpu_percent
+            self.system_memory_percent = system_memory_percent
+            self.system_memory_mb = system_memory_mb
+            self.sessions_data = sessions_data
+            self.tmux_cpu_percent = total_tmux_cpu
+            self.tmux_memory_mb = total_tmux_ram // 1024
+            self.tmux_memory_percent = total_tmux_ram * self.ram_percent_scale
+            self.tmux_process_count = total_tmux_processes
+            self.tmux_window_count = total_tmux_windows
+
+        self.update_refresh_interval(
+            tuple(
+                (s.name, s.process_count, int(s.cpu_total), s.ram_total >> 10)
+                for s in sessions_data
+            )
+        )
 
-        self.tmux_cpu_percent = total_tmux_cpu
-        self.tmux_memory_mb = total_tmux_ram // 1024
-        self.tmux_memory_percent = (
-            (total_tmux_ram * 100) / (self.total_ram_mb * 1024)
-            if self.total_ram_mb > 0
-            else 0
+        snapshot = (
+            system_cpu_percent,
+            system_memory_percent,
+            system_memory_mb,
+            sessions_data,
         )
+        changed = snapshot != self.overview_snapshot
+        self.overview_snapshot = snapshot
+        return changed
 
     def get_tmux_windows(self):
         """Get windows for the specified session."""
-        try:
-            cmd = [
-                "tmux",
-                "list-windows",
-                "-t",
-                self.session_name,
-                "-F",
-                "#{window_index}:#{window_name}",
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            windows = []
-            for line in result.stdout.strip().split("\n"):
-                if line and ":" in line:
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        try:
-                            index = int(parts[0])
-                            name = parts[1]
-                            windows.append((index, name))
-                        except ValueError:
-                            continue
-            return windows
-        except subprocess.CalledProcessError:
-            return []
+        windows = self._snapshot_tmux().get(self.session_name, {})
+        return [(index, name) for index, (name, _) in windows.items()]
 
     def get_pane_pids(self, window_index):
         """Get PIDs for all panes in a window."""
-        try:
-            cmd = [
-                "tmux",
-                "list-panes",
-                "-t",
-                f"{self.session_name}:{window_index}",
-                "-F",
-                "#{pane_pid}",
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            pids = []
-            for pid_str in result.stdout.strip().split("\n"):
-                if pid_str.strip():
-                    try:
-                        pids.append(int(pid_str.strip()))
-                    except ValueError:
-                        continue
-            return pids
-        except subprocess.CalledProcessError:
+        windows = self._snapshot_tmux().get(self.session_name, {})
+        if window_index not in windows:
             return []
+        return list(windows[window_index][1])
 
-    def get_process_info(self, pid, depth=0, parent_pid=None):
-        """Get process info recursively with tree structure."""
+    def get_process_info(self, pid, children_map):
+        """Get process info for a process tree, parents before their children."""
         processes = []
-        try:
-            proc = psutil.Process(pid)
+        # Read the whole tree from /proc at once; None means psutil is needed
+        stats = self.proc_stats.read([pid] + self._descendants(pid, children_map))
+        # Children are pushed in reverse so they pop in map order
+        stack = [(pid, 0, None)]
+        while stack:
+            pid, depth, parent_pid = stack.pop()
             try:
-                cpu_percent = self.get_cpu_percent(pid)
-                memory_info = proc.memory_info()
-                rss_kb = memory_info.rss // 1024
-                cmdline_parts = proc.cmdline()
-                if cmdline_parts:
-                    executable = cmdline_parts[0].split("/")[-1]
-                    args = cmdline_parts[1:] if len(cmdline_parts) > 1 else []
-                    cmdline = executable + (" " + " ".join(args) if args else "")
+                if stats is not None:
+                    stat = stats.get(pid)
+                    if stat is None:
+                        continue  # Exited since the children map was built
+                    cpu_seconds, rss_kb, identity = stat
+                    cpu_percent = self.get_cpu_percent(pid, cpu_seconds=cpu_seconds)
+                    cmdline = self.get_command(pid, identity)
                 else:
-                    cmdline = proc.name()
+                    proc = self._proc(pid)
+                    with proc.oneshot():
+                        cpu_percent = self.get_cpu_percent(pid, proc=proc)
+                        rss_kb = proc.memory_info().rss // 1024
+                        identity = (proc.create_time(), proc.name())
+                        cmdline = self.get_command(pid, identity)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
 
-                # Get parent and siblings to determine is_last_child
-                is_last_child = False
-                if parent_pid is not None:
-                    try:
-                        parent = psutil.Process(parent_pid)
-                        children = list(parent.children())
-                        if children:
-                            last_child = children[-1]
-                            is_last_child = last_child.pid == pid
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-
-                # Get this process's children
-                children = list(proc.children())
-                has_children = len(children) > 0
-
-                processes.append(
-                    {
-                        "pid": pid,
-                        "cpu": cpu_percent,
-                        "memory_kb": rss_kb,
-                        "command": cmdline,
-                        "depth": depth,
-                        "is_last_child": is_last_child,
-                        "has_children": has_children,
-                        "parent_pid": parent_pid,
-                    }
+            # Siblings come from the same map, so the last entry is the last child
+            is_last_child = False
+            if parent_pid is not None:
+                siblings = children_map.get(parent_pid)
+                if siblings:
+                    is_last_child = siblings[-1] == pid
+
+            children = children_map.get(pid, [])
+            has_children = len(children) > 0
+
+            # Values are fixed until the next collection, so format them once
+            pid_cpu = f"{pid:>8} {cpu_percent:>6.1f}"
+            mem_str = self.format_memory(rss_kb)
+
+            processes.append(
+                ProcessInfo(
+                    pid=pid,
+                    cpu=cpu_percent,
+                    memory_kb=rss_kb,
+                    command=cmdline,
+                    depth=depth,
+                    is_last_child=is_last_child,
+                    has_children=has_children,
+                    parent_pid=parent_pid,
+                    base_line=f"{pid_cpu} {mem_str:>12}",
+                    mem_x=len(pid_cpu),
                 )
+            )
 
-                try:
-                    for idx, child in enumerate(children):
-                        child_processes = self.get_process_info(
-                            child.pid, depth + 1, pid
-                        )
-                        processes.extend(child_processes)
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    pass
+            stack.extend(
+                (child_pid, depth + 1, pid) for child_pid in reversed(children)
+            )
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        return processes
 
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+    def get_pane_processes(self, pane_pid, children_map):
+        """Get a pane's process tree, re-reading idle childless panes less often."""
+        if pane_pid in children_map:
+            self.idle_panes.pop(pane_pid, None)
+            return self.get_process_info(pane_pid, children_map)
 
+        quiet_cycles, processes = self.idle_panes.get(pane_pid, (0, None))
+        if quiet_cycles >= IDLE_PANE_CYCLES and quiet_cycles % IDLE_PANE_CYCLES:
+            self.idle_panes[pane_pid] = (quiet_cycles + 1, processes)
+            return processes
+
+        processes = self.get_process_info(pane_pid, children_map)
+        if processes and processes[0].cpu < IDLE_PANE_CPU:
+            self.idle_panes[pane_pid] = (quiet_cycles + 1, processes)
+        else:
+            self.idle_panes.pop(pane_pid, None)
         return processes
 
-    def get_all_process_stats(self, pid):
+    def get_command(self, pid, identity):
+        """Get a process's display command, re-read only when its identity changes.
+
+        identity is (start time, name): the start time changes when the PID is
+        reused and the name when the process execs.
+        """
+        cached = self.cmdline_cache.get(pid)
+        if cached is not None and cached[0] == identity:
+            return cached[1]
+
+        cmdline_parts = self._proc(pid).cmdline()
+        if cmdline_parts:
+            executable = cmdline_parts[0].split("/")[-1]
+            args = cmdline_parts[1:]
+            cmdline = executable + (" " + " ".join(args) if args else "")
+        else:
+            cmdline = identity[1]
+        self.cmdline_cache[pid] = (identity, cmdline)
+        return cmdline
+
+    def get_all_process_stats(self, pid, children_map):
         """Get stats for process and all its children."""
         total_cpu = 0
         total_ram = 0
         total_count = 0
+        pids = [pid] + self._descendants(pid, children_map)
 
-        try:
-            parent = psutil.Process(pid)
-
-            try:
-                total_cpu += self.get_cpu_percent(pid)
-                total_ram += parent.memory_info().rss // 1024
+        stats = self.proc_stats.read(pids)
+        if stats is not None:
+            for stat_pid, (cpu_seconds, rss_kb, _) in stats.items():
+                total_cpu += self.get_cpu_percent(stat_pid, cpu_seconds=cpu_seconds)
+                total_ram += rss_kb
                 total_count += 1
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+            return total_cpu, total_ram, total_count
 
+        for stat_pid in pids:
             try:
-                for child in parent.children(recursive=True):
-                    try:
-                        total_cpu += self.get_cpu_percent(child.pid)
-                        total_ram += child.memory_info().rss // 1024
-                        total_count += 1
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+                proc = self._proc(stat_pid)
+                with proc.oneshot():
+                    total_cpu += self.get_cpu_percent(stat_pid, proc=proc)
+                    total_ram += proc.memory_info().rss // 1024
+                    total_count += 1
             except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
-
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            pass
+                continue
 
         return total_cpu, total_ram, total_count
 
     def collect_window_data(self):
         """Collect data for all windows."""
-        # Remember current window before rebuilding
-        old_window_name = None
-        old_window_index = None
-        if self.windows_data and 0 <= self.current_tab < len(self.windows_data):
-            old_window = self.windows_data[self.current_tab]
-            old_window_name = old_window.name
-            old_window_index = old_window.index
-
+        self.cpu_percent_cache.clear()
         windows = self.get_tmux_windows()
-        old_windows_count = len(self.windows_data)
-        self.windows_data = []
+        children_map = self.build_children_map()
+        self.window_children_map = children_map
+        windows_data = []
 
         for window_index, window_name in windows:
-            pane_pids = self._get_cached_pane_pids(window_index)
+            pane_pids = self.get_pane_pids(window_index)
 
             if not pane_pids:
                 window_stats = WindowStats(
@@ -536,7 +1308,7 @@ class TmuxResourceMonitor:
                     pane_pids=[],
                     processes=[],
                 )
-                self.windows_data.append(window_stats)
+                windows_data.append(window_stats)
                 continue
 
             window_cpu_total = 0
@@ -545,14 +1317,16 @@ class TmuxResourceMonitor:
             all_processes = []
 
             for pane_pid in pane_pids:
-                processes = self.get_process_info(pane_pid)
+                processes = self.get_pane_processes(pane_pid, children_map)
                 all_processes.extend(processes)
 
-                pane_cpu, pane_ram, pane_count = self.get_all_process_stats(pane_pid)
-                window_cpu_total += pane_cpu
-                window_ram_total += pane_ram
-                window_process_count += pane_count
+                # The tree already holds every process, so total it directly
+                for process in processes:
+                    window_cpu_total += process.cpu
+                    window_ram_total += process.memory_kb
+                    window_process_count += 1
 
+            self.assign_tree_prefixes(all_processes)
             window_stats = WindowStats(
                 name=window_name,
                 index=window_index,
@@ -562,38 +1336,73 @@ class TmuxResourceMonitor:
                 pane_pids=pane_pids,
                 processes=all_processes,
             )
-            self.windows_data.append(window_stats)
-
-        if self.windows_data:
-            if old_windows_count == 0 and self.window_filter:
-                # First load: apply window_filter to select initial window
-                for i, window in enumerate(self.windows_data):
-                    if window.name == self.window_filter:
-                        self.current_tab = i
-                        break
-                else:
-                    self.current_tab = 0
-            elif old_window_name is not None:
-                # Subsequent refreshes: preserve current window selection
-                found_idx = None
-                # Try to match by name first
-                for i, window in enumerate(self.windows_data):
-                    if window.name == old_window_name:
-                        found_idx = i
-                        break
-                # Fall back to tmux window index if name match failed
-                if found_idx is None and old_window_index is not None:
+            windows_data.append(window_stats)
+
+        session_cpu_total = 0.0
+        session_ram_total = 0
+        session_process_count = 0
+        for window in windows_data:
+            session_cpu_total += window.cpu_total
+            session_ram_total += window.ram_total
+            session_process_count += window.process_count
+
+        with self.data_lock:
+            # Remember current window before swapping in the new data
+            old_window_name = None
+            old_window_index = None
+            if self.windows_data and 0 <= self.current_tab < len(self.windows_data):
+                old_window = self.windows_data[self.current_tab]
+                old_window_name = old_window.name
+                old_window_index = old_window.index
+            old_windows_count = len(self.windows_data)
+            self.windows_data = windows_data
+            self.session_cpu_total = session_cpu_total
+            self.session_ram_total = session_ram_total
+            self.session_process_count = session_process_count
+
+            if self.windows_data:
+                if old_windows_count == 0 and self.window_filter:
+                    # First load: apply window_filter to select initial window
+                    for i, window in enumerate(self.windows_data):
+                        if window.name == self.window_filter:
+                            self.current_tab = i
+                            break
+                    else:
+                        self.current_tab = 0
+                elif old_window_name is not None:
+                    # Subsequent refreshes: preserve current window selection
+                    found_idx = None
+                    # Try to match by name first
                     for i, window in enumerate(self.windows_data):
-                        if window.index == old_window_index:
+                        if window.name == old_window_name:
                             found_idx = i
                             break
-                if found_idx is not None:
-                    self.current_tab = found_idx
-                else:
-                    # Window was removed, clamp to valid range
-                    self.current_tab = max(
-                        0, min(self.current_tab, len(self.windows_data) - 1)
-                    )
+                    # Fall back to tmux window index if name match failed
+                    if found_idx is None and old_window_index is not None:
+                        for i, window in enumerate(self.windows_data):
+                            if window.index == old_window_index:
+                                found_idx = i
+                                break
+                    if found_idx is not None:
+                        self.current_tab = found_idx
+                    else:
+                        # Window was removed, clamp to valid range
+                        self.current_tab = max(
+                            0, min(self.current_tab, len(self.windows_data) - 1)
+                        )
+
+        self.update_refresh_interval(
+            tuple(
+                (
+                    w.index,
+                    tuple(w.pane_pids),
+                    w.process_count,
+                    int(w.cpu_total),
+                    w.ram_total >> 10,
+                )
+                for w in windows_data
+            )
+        )
 
     def draw_header(self, stdscr, height, width):
         """Draw the header with session summary."""
@@ -601,15 +1410,11 @@ class TmuxResourceMonitor:
             return 2
 
         try:
-            total_cpu = sum(w.cpu_total for w in self.windows_data)
-            total_ram = sum(w.ram_total for w in self.windows_data)
-            total_processes = sum(w.process_count for w in self.windows_data)
+            total_cpu = self.session_cpu_total
+            total_ram = self.session_ram_total
+            total_processes = self.session_process_count
             total_ram_mb = total_ram / 1024
-            total_ram_percent = (
-                (total_ram * 100) / (self.total_ram_mb * 1024)
-                if self.total_ram_mb > 0
-                else 0
-            )
+            total_ram_percent = total_ram * self.ram_percent_scale
 
             # Format memory with GB if >= 1024 MB
             if total_ram_mb >= 1024:
@@ -619,51 +1424,48 @@ class TmuxResourceMonitor:
 
             # Title line - session name with highlighted "Session:"
             x_pos = max(0, (width - len(f"Session: {self.session_name}")) // 2)
-            stdscr.addstr(
-                0,
-                x_pos,
-                "Session:",
-                curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD,
-            )
-            stdscr.addstr(0, x_pos + 8, " ", curses.color_pair(3))
-            stdscr.addstr(
-                0, x_pos + 9, self.session_name, curses.color_pair(3) | curses.A_BOLD
-            )
+            stdscr.addstr(0, x_pos, "Session:", self.session_label_color)
+            stdscr.addstr(0, x_pos + 8, " ", self.colon_color)
+            stdscr.addstr(0, x_pos + 9, self.session_name, self.title_color)
 
             # Summary line with different colors for labels, values, and separators
             # Color values based on usage
+            high_color, medium_color, low_color = self.usage_colors
+            label_color = self.label_color
+            value_color = self.value_color
+            separator_color = self.separator_color
             cpu_color = (
-                curses.color_pair(4)
+                high_color
                 if total_cpu > 80
-                else curses.color_pair(2)
+                else medium_color
                 if total_cpu > 50
-                else curses.color_pair(1)
+                else low_color
                 if total_cpu > 5
-                else curses.color_pair(0)
+                else self.normal_color
             )
             mem_color = (
-                curses.color_pair(4)
+                high_color
                 if total_ram_percent > 80
-                else curses.color_pair(2)
+                else medium_color
                 if total_ram_percent > 50
-                else curses.color_pair(1)
+                else low_color
                 if total_ram_percent > 5
-                else curses.color_pair(0)
+                else self.normal_color
             )
 
             summary_parts = [
-                ("Windows: ", curses.color_pair(2)),
-                (str(len(self.windows_data)), curses.color_pair(1)),
-                (" | ", curses.color_pair(5)),
-                ("CPU: ", curses.color_pair(2)),
+                ("Windows: ", label_color),
+                (str(len(self.windows_data)), value_color),
+                (" | ", separator_color),
+                ("CPU: ", label_color),
                 (f"{total_cpu:.1f}%", cpu_color),
-                (" | ", curses.color_pair(5)),
-                ("MEM: ", curses.color_pair(2)),
+                (" | ", separator_color),
+                ("MEM: ", label_color),
                 (mem_str, mem_color),
                 (f" ({total_ram_percent:.1f}%)", mem_color),
-                (" | ", curses.color_pair(5)),
-                ("Processes: ", curses.color_pair(2)),
-                (str(total_processes), curses.color_pair(1)),
+                (" | ", separator_color),
+                ("Processes: ", label_color),
+                (str(total_processes), value_color),
             ]
 
             # Build the full string and calculate positions for colored segments
@@ -677,11 +1479,8 @@ class TmuxResourceMonitor:
             for text, color in summary_parts:
                 if current_x + len(text) > width - 1:
                     break
-                try:
-                    stdscr.addstr(1, current_x, text, color)
-                    current_x += len(text)
-                except curses.error:
-                    break
+                stdscr.addstr(1, current_x, text, color)
+                current_x += len(text)
 
         except curses.error:
             pass  # Skip drawing if there's an error
@@ -694,43 +1493,36 @@ class TmuxResourceMonitor:
             return y_pos + 1
 
         x_pos = 0
-        stdscr.addstr(y_pos, x_pos, "Windows", curses.color_pair(6) | curses.A_BOLD)
+        stdscr.addstr(y_pos, x_pos, "Windows", self.heading_color)
         x_pos += 7
-        stdscr.addstr(y_pos, x_pos, ": ", curses.color_pair(3))
+        stdscr.addstr(y_pos, x_pos, ": ", self.colon_color)
         x_pos += 2
 
         for i, window in enumerate(self.windows_data):
-            if i > 0:
-                stdscr.addstr(y_pos, x_pos, " | ", curses.color_pair(2))
-                x_pos += 3
-
             display_name = window.name
             if len(display_name) > 12:
                 display_name = display_name[:9] + "..."
+            if i == self.current_tab:
+                display_name = f"[{display_name}]"
+
+            # Stop at the first tab that would run past the right edge
+            separator = " | " if i > 0 else ""
+            if x_pos + len(separator) + len(display_name) > width - 1:
+                break
+
+            if separator:
+                stdscr.addstr(y_pos, x_pos, separator, self.label_color)
+                x_pos += len(separator)
 
             if i == self.current_tab:
-                try:
-                    stdscr.addstr(
-                        y_pos,
-                        x_pos,
-                        f"[{display_name}]",
-                        curses.color_pair(2) | curses.A_REVERSE,
-                    )
-                except curses.error:
-                    pass
+                stdscr.addstr(y_pos, x_pos, display_name, self.current_tab_color)
             else:
-                try:
-                    stdscr.addstr(y_pos, x_pos, display_name, curses.color_pair(2))
-                except curses.error:
-                    pass
-
+                stdscr.addstr(y_pos, x_pos, display_name, self.label_color)
             x_pos += len(display_name)
-            if i == self.current_tab:
-                x_pos += 2  # Account for brackets
 
         counter_text = f" ({self.current_tab + 1}/{len(self.windows_data)})"
         if x_pos + len(counter_text) < width:
-            stdscr.addstr(y_pos, x_pos, counter_text, curses.color_pair(2))
+            stdscr.addstr(y_pos, x_pos, counter_text, self.label_color)
 
         return y_pos + 1
 
@@ -758,35 +1550,32 @@ class TmuxResourceMonitor:
 
         # Window header with different colors for label, values, and separators
         window_parts = [
-            ("Window", curses.color_pair(6) | curses.A_BOLD),
-            (": ", curses.color_pair(3)),
-            (window.name, curses.color_pair(2) | curses.A_BOLD),
-            (f" ({window.index})", curses.color_pair(1) | curses.A_BOLD),
-            (" - ", curses.color_pair(5)),
-            (f"{len(window.pane_pids)}", curses.color_pair(1) | curses.A_BOLD),
-            (" panes", curses.color_pair(2)),
+            ("Window", self.heading_color),
+            (": ", self.colon_color),
+            (window.name, self.window_name_color),
+            (f" ({window.index})", self.window_value_color),
+            (" - ", self.separator_color),
+            (f"{len(window.pane_pids)}", self.window_value_color),
+            (" panes", self.label_color),
         ]
 
         current_x = 0
         for text, color in window_parts:
             if current_x + len(text) > width - 1:
                 break
-            try:
-                stdscr.addstr(y_pos, current_x, text, color)
-                current_x += len(text)
-            except curses.error:
-                break
+            stdscr.addstr(y_pos, current_x, text, color)
+            current_x += len(text)
 
         y_pos += 1
 
         # Process table header
         header = f"{'PID':>8} {'CPU%':>6} {'MEM':>12} COMMAND"
-        stdscr.addstr(y_pos, 0, header, curses.color_pair(3) | curses.A_BOLD)
+        stdscr.addstr(y_pos, 0, header, self.title_color)
         y_pos += 1
 
         # Separator line
         separator = "-" * min(width - 1, 60)
-        stdscr.addstr(y_pos, 0, separator, curses.color_pair(5))
+        stdscr.addstr(y_pos, 0, separator, self.separator_color)
         y_pos += 1
 
         # Calculate how many lines we can use for process list
@@ -806,7 +1595,6 @@ class TmuxResourceMonitor:
             self.process_browsing_active = False
 
         # Process list
-        displayed_processes = 0
         first_displayed_process = 0
 
         # If browsing is active, try to keep selected process visible
@@ -816,19 +1604,20 @@ class TmuxResourceMonitor:
                     self.selected_process_index - lines_for_processes + 1
                 )
 
-        for process_idx, process in enumerate(window.processes):
-            if process_idx < first_displayed_process:
-                continue
-            if displayed_processes >= lines_for_processes:
-                break
-
-            tree_prefix = self.get_tree_prefix(process, window.processes, process_idx)
-            mem_str = self.format_memory(process["memory_kb"])
-
-            command = process["command"]
-
-            # Build base line without tree (PID, CPU, MEM)
-            base_line = f"{process['pid']:>8} {process['cpu']:>6.1f} {mem_str:>12}"
+        high_color, medium_color, low_color = self.usage_colors
+        normal_color = self.normal_color
+        selected_color = self.selected_color
+        tree_color, selected_tree_color = self.tree_colors
+
+        # Only the rows that fit are visited, however long the list is
+        end_displayed_process = first_displayed_process + max(0, lines_for_processes)
+        for process_idx, process in enumerate(
+            window.processes[first_displayed_process:end_displayed_process],
+            first_displayed_process,
+        ):
+            tree_prefix = process.tree_prefix
+            command = process.command
+            base_line = process.base_line
             base_line_len = len(base_line)
 
             # Tree starts right after base_line
@@ -852,14 +1641,20 @@ class TmuxResourceMonitor:
                     if self.horizontal_scroll_offset > 0:
                         command = "<<" + command[2:]
                     if self.horizontal_scroll_offset + max_cmd_len < len(
-                        process["command"]
+                        process.command
                     ):
                         command = command[:-2] + ">>"
                 else:
                     command = command[:max_cmd_len]
             else:
-                if len(command) > max_cmd_len and max_cmd_len > 3:
-                    command = command[: max_cmd_len - 3] + "..."
+                # Truncate once per process and width, not on every frame
+                cached = process.truncated_command
+                if cached is not None and cached[0] == max_cmd_len:
+                    command = cached[1]
+                else:
+                    if len(command) > max_cmd_len and max_cmd_len > 3:
+                        command = command[: max_cmd_len - 3] + "..."
+                    process.truncated_command = (max_cmd_len, command)
 
             is_selected = (
                 self.process_browsing_active
@@ -867,82 +1662,60 @@ class TmuxResourceMonitor:
             )
 
             try:
-                # Draw the base line (PID, CPU, MEM)
+                # Write the whole row once, then recolor the columns in place
+                row = f"{base_line}{tree_prefix} {command}"
                 if is_selected:
-                    stdscr.addstr(y_pos, 0, base_line, curses.color_pair(8))
+                    stdscr.addstr(y_pos, 0, row, selected_color)
                 else:
-                    # Draw PID
-                    pid_str = f"{process['pid']:>8}"
-                    stdscr.addstr(y_pos, 0, pid_str, curses.color_pair(0))
+                    stdscr.addstr(y_pos, 0, row, normal_color)
 
-                    # Draw CPU with color
-                    cpu = process["cpu"]
-                    cpu_str = f" {cpu:>6.1f}"
+                    # CPU column (between the 8-wide PID and MEM) with color
+                    cpu = process.cpu
                     if cpu > 50:
-                        cpu_color = curses.color_pair(4)  # Red
+                        cpu_color = high_color
                     elif cpu > 20:
-                        cpu_color = curses.color_pair(2)  # Yellow
+                        cpu_color = medium_color
                     elif cpu > 5:
-                        cpu_color = curses.color_pair(1)  # Green
+                        cpu_color = low_color
                     else:
-                        cpu_color = curses.color_pair(0)  # Default
-                    stdscr.addstr(y_pos, len(pid_str), cpu_str, cpu_color)
+                        cpu_color = None  # Default
+                    if cpu_color is not None:
+                        stdscr.chgat(y_pos, 8, process.mem_x - 8, cpu_color)
 
-                    # Draw MEM with color
-                    mem_str = f" {self.format_memory(process['memory_kb']):>12}"
-                    mem_percent = (process["memory_kb"] * 100) / (self.total_ram_mb * 1024)
+                    # MEM column (up to the tree prefix) with color
+                    mem_percent = process.memory_kb * self.ram_percent_scale
                     if mem_percent > 20:
-                        mem_color = curses.color_pair(4)  # Red
+                        mem_color = high_color
                     elif mem_percent > 10:
-                        mem_color = curses.color_pair(2)  # Yellow
+                        mem_color = medium_color
                     elif mem_percent > 5:
-                        mem_color = curses.color_pair(1)  # Green
+                        mem_color = low_color
                     else:
-                        mem_color = curses.color_pair(0)  # Default
-                    stdscr.addstr(y_pos, len(pid_str) + len(cpu_str), mem_str, mem_color)
-
-                # Draw tree prefix in cyan (no extra space before - starts at tree_x)
-                if tree_prefix:
-                    if is_selected:
-                        stdscr.addstr(
-                            y_pos,
-                            tree_x,
-                            tree_prefix,
-                            curses.color_pair(10) | curses.A_BOLD,
-                        )
-                    else:
-                        stdscr.addstr(
-                            y_pos,
-                            tree_x,
-                            tree_prefix,
-                            curses.color_pair(9) | curses.A_BOLD,
+                        mem_color = None  # Default
+                    if mem_color is not None:
+                        stdscr.chgat(
+                            y_pos, process.mem_x, tree_x - process.mem_x, mem_color
                         )
 
-                # Draw space between tree prefix and command with appropriate color
-                space_x = tree_x + len(tree_prefix)
-                if is_selected:
-                    stdscr.addstr(y_pos, space_x, " ", curses.color_pair(8))
-                else:
-                    stdscr.addstr(y_pos, space_x, " ", curses.color_pair(0))
-
-                # Draw command at calculated position (tree_x + prefix length + 1 for space)
-                if is_selected:
-                    stdscr.addstr(y_pos, command_x, command, curses.color_pair(8))
-                else:
-                    # Command uses default color
-                    stdscr.addstr(y_pos, command_x, command, curses.color_pair(0))
+                # Tree prefix in cyan (starts right after base_line at tree_x)
+                if tree_prefix:
+                    stdscr.chgat(
+                        y_pos,
+                        tree_x,
+                        len(tree_prefix),
+                        selected_tree_color if is_selected else tree_color,
+                    )
 
             except curses.error:
                 break
             y_pos += 1
-            displayed_processes += 1
 
         # Window totals - always show at bottom
         # Move to the line just before footer
         totals_y = height - 2
 
         window_ram_mb = window.ram_total / 1024
-        window_ram_percent = (window.ram_total * 100) / (self.total_ram_mb * 1024)
+        window_ram_percent = window.ram_total * self.ram_percent_scale
 
         # Format memory with GB if >= 1024 MB
         if window_ram_mb >= 1024:
@@ -957,13 +1730,13 @@ class TmuxResourceMonitor:
 
         # Color based on usage
         if window.cpu_total > 80 or window_ram_percent > 80:
-            total_color = curses.color_pair(4) | curses.A_BOLD  # Red
+            total_color = self.total_colors[0]
         elif window.cpu_total > 50 or window_ram_percent > 50:
-            total_color = curses.color_pair(2) | curses.A_BOLD  # Yellow
+            total_color = self.total_colors[1]
         elif window.cpu_total > 5 or window_ram_percent > 5:
-            total_color = curses.color_pair(1) | curses.A_BOLD  # Green
+            total_color = self.total_colors[2]
         else:
-            total_color = curses.color_pair(0) | curses.A_BOLD  # Default
+            total_color = self.total_colors[3]
 
         try:
             stdscr.addstr(totals_y, 0, total_line, total_color)
@@ -972,53 +1745,34 @@ class TmuxResourceMonitor:
 
         return y_pos
 
+    def draw_loading(self, stdscr, height, width, message):
+        """Draw a centered loading message."""
+        stdscr.addstr(
+            height // 2,
+            max(0, (width - len(message)) // 2),
+            message,
+            self.title_color,
+        )
+
     def draw_footer(self, stdscr, height, width):
         """Draw the footer with refresh info."""
-        footer = "Press 'q' to quit, '?' for help"
-        stdscr.addstr(height - 1, 0, footer, curses.color_pair(5))
+        stdscr.addstr(height - 1, 0, SESSION_FOOTER, self.footer_color)
+
+    def draw_overview_footer(self, stdscr, height, width):
+        """Draw the overview key hints, shortened when they do not fit."""
+        if width > len(OVERVIEW_FOOTER):
+            footer = OVERVIEW_FOOTER
+        else:
+            footer = OVERVIEW_FOOTER_SHORT
+        stdscr.addstr(height - 1, 0, footer, self.footer_color)
 
     def draw_help(self, stdscr, height, width):
         """Draw the help screen."""
         stdscr.erase()
 
-        help_lines = [
-            "Tmux Resource Monitor - Keyboard Controls",
-            "",
-            "Navigation:",
-            "  o or O                Go back to overview of all sessions",
-            "  <- -> or h l          Navigate between windows",
-            "  q or Q                Exit the monitor",
-            "  ?                     Show/hide this help screen",
-            "",
-            "Process Browsing (press j or down to start):",
-            "  j/k or up/down        Navigate up/down through processes",
-            "  Alt+h/l or Alt+<- ->  Scroll long command lines horizontally",
-            "  x                     Send SIGTERM (15) to selected process",
-            "  s                     Enter signal number to send custom signal",
-            "  y                     Copy process command to clipboard",
-            "  Y                     Copy process PID to clipboard",
-            "  <- -> or h l          Navigate between windows (works in all modes)",
-            "",
-            "Display:",
-            "  Header                Shows session name and total resource usage",
-            "  Tabs                  Shows available windows (current window is highlighted)",
-            "  Process List          Shows processes in the current window",
-            "  Footer                Shows exit instructions",
-            "",
-            "Features:",
-            "  • Session summary with total resource usage",
-            "  • Interactive window navigation",
-            "  • Process tree visualization for selected window",
-            "  • Process selection and signal sending",
-            "  • Real-time updates",
-            "  • Lightweight curses-based interface",
-            "",
-            "Press any key to return to the monitor...",
-        ]
-
-        start_y = max(0, (height - len(help_lines)) // 2)
+        start_y = max(0, (height - len(HELP_LINES)) // 2)
 
-        for i, line in enumerate(help_lines):
+        for i, line in enumerate(HELP_LINES):
             if start_y + i < height - 1:
                 try:
                     if i == 0:
@@ -1026,22 +1780,20 @@ class TmuxResourceMonitor:
                             start_y + i,
                             (width - len(line)) // 2,
                             line,
-                            curses.color_pair(3) | curses.A_BOLD,
+                            self.title_color,
                         )
                     else:
                         stdscr.addstr(start_y + i, 0, line, curses.color_pair(0))
                 except curses.error:
                     pass
 
-        stdscr.refresh()
-
     def draw_overview(self, stdscr, height, width):
         """Draw the overview screen with system stats and session table."""
         y_pos = 0
 
         title = "System Resource Overview"
         x_pos = max(0, (width - len(title)) // 2)
-        stdscr.addstr(y_pos, x_pos, title, curses.color_pair(3) | curses.A_BOLD)
+        stdscr.addstr(y_pos, x_pos, title, self.title_color)
         if self.browse_sessions:
             stdscr.addstr(
                 y_pos,
@@ -1120,15 +1872,15 @@ class TmuxResourceMonitor:
         y_pos += 2
 
         separator = "-" * (width - 1)
-        stdscr.addstr(y_pos, 0, separator, curses.color_pair(5))
+        stdscr.addstr(y_pos, 0, separator, self.separator_color)
         y_pos += 1
 
         header = f"{'Session':<20} {'CPU%':>8} {'MEM':>12} {'Procs':>7} {'Wins':>6}"
-        stdscr.addstr(y_pos, 0, header, curses.color_pair(3) | curses.A_BOLD)
+        stdscr.addstr(y_pos, 0, header, self.title_color)
         y_pos += 1
 
         separator = "-" * (width - 1)
-        stdscr.addstr(y_pos, 0, separator, curses.color_pair(5))
+        stdscr.addstr(y_pos, 0, separator, self.separator_color)
         y_pos += 1
 
         if not self.sessions_data:
@@ -1149,6 +1901,10 @@ class TmuxResourceMonitor:
             if self.selected_session_index >= available_lines:
                 first_displayed = self.selected_session_index - available_lines + 1
 
+        high_color, medium_color, low_color = self.usage_colors
+        normal_color = self.normal_color
+        selected_color = self.selected_session_color
+
         for idx, session in enumerate(self.sessions_data):
             line_idx = idx - first_displayed
             if line_idx < 0:
@@ -1159,11 +1915,7 @@ class TmuxResourceMonitor:
             current_y = y_pos + line_idx
 
             ram_mb = session.ram_total / 1024
-            ram_percent = (
-                (session.ram_total * 100) / (self.total_ram_mb * 1024)
-                if self.total_ram_mb > 0
-                else 0
-            )
+            ram_percent = session.ram_total * self.ram_percent_scale
 
             # Format memory with GB if >= 1024 MB
             if ram_mb >= 1024:
@@ -1177,15 +1929,15 @@ class TmuxResourceMonitor:
             row = f"{prefix}{session.name[:18]:<20} {session.cpu_total:>7.1f}% {ram_display}({ram_percent:>4.1f}%) {session.process_count:>7} {session.window_count:>6}"
 
             if is_selected:
-                color = curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD
+                color = selected_color
             elif session.cpu_total > 80 or ram_percent > 80:
-                color = curses.color_pair(4)  # Red - high usage
+                color = high_color
             elif session.cpu_total > 50 or ram_percent > 50:
-                color = curses.color_pair(2)  # Yellow - medium usage
+                color = medium_color
             elif session.cpu_total > 5 or ram_percent > 5:
-                color = curses.color_pair(1)  # Green - low usage
+                color = low_color
             else:
-                color = curses.color_pair(0)  # Default
+                color = normal_color
 
             try:
                 stdscr.addstr(current_y, 0, row[: width - 1], color)
@@ -1194,8 +1946,8 @@ class TmuxResourceMonitor:
 
         totals_cpu = self.tmux_cpu_percent
         totals_ram_mb = self.tmux_memory_mb
-        totals_procs = sum(s.process_count for s in self.sessions_data)
-        totals_wins = sum(s.window_count for s in self.sessions_data)
+        totals_procs = self.tmux_process_count
+        totals_wins = self.tmux_window_count
 
         totals_line = f"{'TOTAL':<20} {totals_cpu:>7.1f}% {totals_ram_mb:>6d}MB({self.tmux_memory_percent:>4.1f}%) {totals_procs:>7} {totals_wins:>6}"
         totals_y = height - 3
@@ -1216,7 +1968,7 @@ class TmuxResourceMonitor:
             return
 
         process = window.processes[self.selected_process_index]
-        prompt = f"Send signal to PID {process['pid']}: [ {self.input_buffer} ]"
+        prompt = f"Send signal to PID {process.pid}: [ {self.input_buffer} ]"
 
         # Draw prompt just above the footer
         prompt_y = height - 2
@@ -1226,9 +1978,8 @@ class TmuxResourceMonitor:
             stdscr.move(prompt_y, 0)
             stdscr.clrtoeol()
             # Draw prompt
-            stdscr.addstr(prompt_y, 0, prompt, curses.color_pair(3) | curses.A_BOLD)
+            stdscr.addstr(prompt_y, 0, prompt, self.title_color)
             stdscr.move(prompt_y, len(prompt) - len(self.input_buffer) - 2)
-            stdscr.refresh()
         except curses.error:
             pass
 
@@ -1236,11 +1987,19 @@ class TmuxResourceMonitor:
         """Switch to next tab."""
         if self.windows_data:
             self.current_tab = (self.current_tab + 1) % len(self.windows_data)
+            self.stop_process_browsing()
 
     def prev_tab(self):
         """Switch to previous tab."""
         if self.windows_data:
             self.current_tab = (self.current_tab - 1) % len(self.windows_data)
+            self.stop_process_browsing()
+
+    def stop_process_browsing(self):
+        """Drop the process selection, which also lets timed refreshes resume."""
+        self.process_browsing_active = False
+        self.selected_process_index = 0
+        self.horizontal_scroll_offset = 0
 
     def send_signal_to_process(self, signal_number):
         """Send a signal to the currently selected process."""
@@ -1253,8 +2012,11 @@ class TmuxResourceMonitor:
 
         process = window.processes[self.selected_process_index]
         try:
-            proc = psutil.Process(process["pid"])
+            proc = self._proc(process.pid)
             proc.send_signal(signal_number)
+            # Sample now rather than leave the list stale until the next key
+            self.refresh_requested.set()
+            self.collector_wakeup.set()
             return True
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             return False
@@ -1263,62 +2025,36 @@ class TmuxResourceMonitor:
         """Copy text to clipboard using available clipboard tools (Wayland/X11).
         Runs asynchronously to prevent UI freezing."""
 
-        def async_copy():
-            """Run clipboard copy in background thread with timeout."""
-            # Try wl-copy first (Wayland)
-            try:
-                subprocess.run(
-                    ["wl-copy"],
-                    input=text.encode("utf-8"),
-                    timeout=1.0,
-                    capture_output=True,
-                    check=True,
-                )
-                return
-            except (
-                FileNotFoundError,
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-            ):
-                pass
-
-            # Fallback to xclip (X11)
-            try:
-                subprocess.run(
-                    ["xclip", "-selection", "clipboard"],
-                    input=text.encode("utf-8"),
-                    timeout=1.0,
-                    capture_output=True,
-                    check=True,
-                )
-                return
-            except (
-                FileNotFoundError,
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-            ):
-                pass
+        if not self.clipboard_commands:
+            return False
 
-            # Fallback to xsel (X11)
-            try:
-                subprocess.run(
-                    ["xsel", "--clipboard", "--input"],
-                    input=text.encode("utf-8"),
-                    timeout=1.0,
-                    capture_output=True,
-                    check=True,
-                )
-                return
-            except (
-                FileNotFoundError,
-                subprocess.TimeoutExpired,
-                subprocess.CalledProcessError,
-            ):
-                pass
+        def async_copy():
+            """Run clipboard copy on the clipboard worker with timeout."""
+            # An installed tool can still fail (e.g. wl-copy outside Wayland),
+            # so fall back to the next one
+            data = text.encode("utf-8")
+            for command in self.clipboard_commands:
+                # The tools print nothing worth reading, and xclip/wl-copy
+                # fork a child that would hold captured pipes open
+                try:
+                    proc = subprocess.Popen(
+                        command,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                    )
+                except FileNotFoundError:
+                    continue
+                try:
+                    proc.communicate(data, timeout=1.0)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    continue
+                if proc.returncode == 0:
+                    return
 
-        # Start async copy in daemon thread
-        thread = threading.Thread(target=async_copy, daemon=True)
-        thread.start()
+        self.clipboard_pool.submit(async_copy)
         return True
 
     def copy_process_command(self):
@@ -1331,7 +2067,7 @@ class TmuxResourceMonitor:
             return False
 
         process = window.processes[self.selected_process_index]
-        return self.copy_to_clipboard(process["command"])
+        return self.copy_to_clipboard(process.command)
 
     def copy_process_pid(self):
         """Copy the selected process's PID to clipboard."""
@@ -1343,402 +2079,336 @@ class TmuxResourceMonitor:
             return False
 
         process = window.processes[self.selected_process_index]
-        return self.copy_to_clipboard(str(process["pid"]))
+        return self.copy_to_clipboard(str(process.pid))
+
+    def quit(self):
+        """Stop the monitor."""
+        self.running = False
+
+    def toggle_help(self):
+        """Show the help screen; the next key dismisses it."""
+        self.show_help = True
+
+    def return_to_overview(self):
+        """Go back to overview mode."""
+        if not self.show_overview:
+            self.show_overview = True
+            self.browse_sessions = False
+            self.stop_process_browsing()
+            self.request_refresh()
+
+    def select_next(self):
+        """Move the session or process selection down, wrapping at the end."""
+        if self.show_overview:
+            self.browse_sessions = True
+            if not self.sessions_data:
+                pass
+            elif self.selected_session_index < len(self.sessions_data) - 1:
+                self.selected_session_index += 1
+            else:
+                self.selected_session_index = 0
+        elif self.windows_data and self.windows_data[self.current_tab].processes:
+            self.process_browsing_active = True
+            window = self.windows_data[self.current_tab]
+            if self.selected_process_index < len(window.processes) - 1:
+                self.selected_process_index += 1
+            else:
+                self.selected_process_index = 0
 
-    def handle_input(self, stdscr):
-        """Handle keyboard input - no separate thread to avoid curses issues."""
-        stdscr.nodelay(True)  # Non-blocking input
+    def select_previous(self):
+        """Move the session or process selection up, wrapping at the start."""
+        if self.show_overview:
+            self.browse_sessions = True
+            if self.selected_session_index > 0:
+                self.selected_session_index -= 1
+            elif self.sessions_data:
+                self.selected_session_index = len(self.sessions_data) - 1
+        elif self.process_browsing_active and self.windows_data:
+            window = self.windows_data[self.current_tab]
+            if window.processes:
+                if self.selected_process_index > 0:
+                    self.selected_process_index -= 1
+                else:
+                    self.selected_process_index = len(window.processes) - 1
+
+    def copy_selected_command(self):
+        """Copy the selected process command to the clipboard."""
+        if self.process_browsing_active:
+            self.copy_process_command()
+
+    def copy_selected_pid(self):
+        """Copy the selected process PID to the clipboard."""
+        if self.process_browsing_active:
+            self.copy_process_pid()
+
+    def start_signal_input(self):
+        """Enter signal input mode for the selected process."""
+        if self.process_browsing_active:
+            self.input_mode = "signal"
+            self.input_buffer = ""
+
+    def open_selected_session(self):
+        """Show the details of the session selected in the overview."""
+        if self.show_overview and self.browse_sessions and self.sessions_data:
+            if self.selected_session_index < len(self.sessions_data):
+                selected = self.sessions_data[self.selected_session_index]
+                self.show_overview = False
+                self.browse_sessions = False
+                self.session_name = selected.name
+                self.current_tab = 0
+                self.stop_process_browsing()
+                self.request_refresh()
+
+    def terminate_selected(self):
+        """Send SIGTERM to the selected process."""
+        if self.process_browsing_active:
+            self.send_signal_to_process(15)  # SIGTERM
+        elif (
+            self.show_overview
+            and self.browse_sessions
+            and self.sessions_data
+            and self.selected_session_index > 0
+        ):
+            self.selected_session_index -= 1
+        elif self.show_overview:
+            self.browse_sessions = True
+            if self.sessions_data:
+                self.selected_session_index = len(self.sessions_data) - 1
+        else:
+            self.prev_tab()
 
+    def handle_input(self, stdscr):
+        """Handle one queued keypress; return False once no key is pending."""
+        key = -1
         try:
             key = stdscr.getch()
             if key != -1:  # Key was pressed
-                # Handle input mode (signal number entry) first
-                if self.input_mode == "signal":
-                    if key == 10 or key == 13:  # Enter
-                        if self.input_buffer.strip():
-                            try:
-                                signal_number = int(self.input_buffer.strip())
-                                self.send_signal_to_process(signal_number)
-                            except ValueError:
-                                pass  # Invalid number, ignore
-                        self.input_mode = None
-                        self.input_buffer = ""
-                    elif key == 27:  # ESC
-                        self.input_mode = None
-                        self.input_buffer = ""
-                    elif key == curses.KEY_BACKSPACE or key == 127:
-                        if self.input_buffer:
-                            self.input_buffer = self.input_buffer[:-1]
-                    elif 48 <= key <= 57:  # 0-9
-                        self.input_buffer += chr(key)
-                    return
-
-                # Handle Alt key combinations
-                if key == 27:  # ESC - could be Alt+key or just ESC
-                    # Try to detect Alt+key by checking for another key quickly
-                    stdscr.timeout(50)  # Short timeout to detect Alt
-                    next_key = stdscr.getch()
-                    stdscr.timeout(-1)  # Reset to blocking
-                    stdscr.nodelay(True)  # Set back to non-blocking
-
-                    if next_key != -1:  # Alt+key combination
-                        # Alt+key detected
-                        alt_key = next_key
-                        if self.process_browsing_active and self.windows_data:
-                            window = self.windows_data[self.current_tab]
-                            if window.processes and self.selected_process_index < len(
-                                window.processes
-                            ):
-                                process = window.processes[self.selected_process_index]
-                                command = process["command"]
-
-                                tree_prefix = self.get_tree_prefix(
-                                    process,
-                                    window.processes,
-                                    self.selected_process_index,
-                                )
-                                # Calculate actual base line length to get correct positioning
-                                base_line = f"{process['pid']:>8} {process['cpu']:>6.1f} {self.format_memory(process['memory_kb']):>12}"
-                                base_line_len = len(base_line)
-                                # Command starts after base_line + tree_prefix + 1 space
-                                command_start = base_line_len + len(tree_prefix) + 1
-                                height, width = stdscr.getmaxyx()
-                                max_cmd_len = width - command_start - 1
+                redraw_pending = self.needs_redraw
+                self.needs_redraw = True
+                self.input_since_refresh = True
+                if key == curses.KEY_RESIZE:
+                    self.screen_size = stdscr.getmaxyx()
+                with self.data_lock:
+                    # Any interaction brings the refresh rate back to normal
+                    if self.current_refresh_interval != self.refresh_rate:
+                        self.current_refresh_interval = self.refresh_rate
 
+                    if self.show_help:
+                        # Any key but a resize closes help and does nothing else
+                        if key != curses.KEY_RESIZE:
+                            self.show_help = False
+                        return True
+
+                    # Handle input mode (signal number entry) first
+                    if self.input_mode == "signal":
+                        if key == 10 or key == 13:  # Enter
+                            if self.input_buffer.strip():
+                                try:
+                                    signal_number = int(self.input_buffer.strip())
+                                    self.send_signal_to_process(signal_number)
+                                except ValueError:
+                                    pass  # Invalid number, ignore
+                            self.input_mode = None
+                            self.input_buffer = ""
+                        elif key == 27:  # ESC
+                            self.input_mode = None
+                            self.input_buffer = ""
+                        elif key in BACKSPACE_KEYS:
+                            if self.input_buffer:
+                                self.input_buffer = self.input_buffer[:-1]
+                        elif 48 <= key <= 57:  # 0-9
+                            if len(self.input_buffer) < MAX_SIGNAL_DIGITS:
+                                self.input_buffer += chr(key)
+                        return True
+
+                    # Handle Alt key combinations
+                    if key == 27:  # ESC - could be Alt+key or just ESC
+                        # curses already waited for the rest of an escape
+                        # sequence, so the key of an Alt combo is buffered
+                        next_key = stdscr.getch()
+
+                        if next_key != -1:  # Alt+key combination
+                            # Alt+key detected
+                            alt_key = next_key
+                            if self.process_browsing_active and self.windows_data:
+                                window = self.windows_data[self.current_tab]
                                 if (
-                                    alt_key == curses.KEY_LEFT
-                                    or alt_key == ord("h")
-                                    or alt_key == ord("H")
-                                ):
-                                    self.horizontal_scroll_offset = max(
-                                        0, self.horizontal_scroll_offset - 10
-                                    )
-                                elif (
-                                    alt_key == curses.KEY_RIGHT
-                                    or alt_key == ord("l")
-                                    or alt_key == ord("L")
+                                    window.processes
+                                    and self.selected_process_index
+                                    < len(window.processes)
                                 ):
-                                    max_offset = max(0, len(command) - max_cmd_len + 4)
-                                    self.horizontal_scroll_offset = min(
-                                        max_offset, self.horizontal_scroll_offset + 10
-                                    )
-                        return
-                    # If we get here, it was just ESC, fall through to ESC handler below
-
-                # Normal mode or process browsing mode
-                if key == ord("q") or key == ord("Q"):
-                    self.running = False
-                elif key == ord("?"):
-                    self.show_help = not self.show_help
-                    if self.show_help:
-                        self.draw_help(
-                            stdscr, stdscr.getmaxyx()[0], stdscr.getmaxyx()[1]
-                        )
-                        stdscr.nodelay(False)
-                        stdscr.getch()
-                        stdscr.nodelay(True)
-                        self.show_help = False
-                elif key == ord("o") or key == ord("O"):
-                    # Go back to overview mode
-                    if not self.show_overview:
-                        self.show_overview = True
-                        self.browse_sessions = False
-                        self.collect_system_stats()
-                elif key == curses.KEY_LEFT or key == ord("h") or key == ord("H"):
-                    self.prev_tab()
-                elif key == curses.KEY_RIGHT or key == ord("l") or key == ord("L"):
-                    self.next_tab()
-                elif key == ord("j") or key == curses.KEY_DOWN:
-                    if self.show_overview:
-                        self.browse_sessions = True
-                        if not self.sessions_data:
-                            pass
-                        elif self.selected_session_index < len(self.sessions_data) - 1:
-                            self.selected_session_index += 1
-                        else:
-                            self.selected_session_index = 0
-                    elif (
-                        self.windows_data
-                        and self.windows_data[self.current_tab].processes
-                    ):
-                        self.process_browsing_active = True
-                        window = self.windows_data[self.current_tab]
-                        if self.selected_process_index < len(window.processes) - 1:
-                            self.selected_process_index += 1
-                        else:
-                            self.selected_process_index = 0
-                elif key == ord("k") or key == curses.KEY_UP:
-                    if self.show_overview:
-                        self.browse_sessions = True
-                        if self.selected_session_index > 0:
-                            self.selected_session_index -= 1
-                        elif self.sessions_data:
-                            self.selected_session_index = len(self.sessions_data) - 1
-                    elif self.process_browsing_active and self.windows_data:
-                        window = self.windows_data[self.current_tab]
-                        if window.processes:
-                            if self.selected_process_index > 0:
-                                self.selected_process_index -= 1
-                            else:
-                                self.selected_process_index = len(window.processes) - 1
-                elif key == ord("y"):
-                    # Copy process command to clipboard
-                    if self.process_browsing_active:
-                        self.copy_process_command()
-                elif key == ord("Y"):
-                    # Copy process PID to clipboard
-                    if self.process_browsing_active:
-                        self.copy_process_pid()
-                elif key == ord("s") or key == ord("S"):
-                    # Enter signal input mode
-                    if self.process_browsing_active:
-                        self.input_mode = "signal"
-                        self.input_buffer = ""
-                elif key == 3:  # Ctrl+C
-                    self.running = False
-                elif key == 10 or key == 13:  # Enter
-                    if (
-                        self.show_overview
-                        and self.browse_sessions
-                        and self.sessions_data
-                    ):
-                        if self.selected_session_index < len(self.sessions_data):
-                            selected = self.sessions_data[self.selected_session_index]
-                            self.show_overview = False
-                            self.browse_sessions = False
-                            self.session_name = selected.name
-                            self.current_tab = 0
-                            self.collect_window_data()
-                elif key == 27:  # ESC
-                    # Go back to overview mode
-                    if not self.show_overview:
-                        self.show_overview = True
-                        self.browse_sessions = False
-                        self.collect_system_stats()
-                elif key == ord("j") or key == curses.KEY_DOWN:
-                    if self.show_overview:
-                        self.browse_sessions = True
-                        if not self.sessions_data:
-                            pass
-                        elif self.selected_session_index < len(self.sessions_data) - 1:
-                            self.selected_session_index += 1
-                        else:
-                            self.selected_session_index = 0
-                    elif (
-                        self.windows_data
-                        and self.windows_data[self.current_tab].processes
-                    ):
-                        self.process_browsing_active = True
-                        window = self.windows_data[self.current_tab]
-                        if self.selected_process_index < len(window.processes) - 1:
-                            self.selected_process_index += 1
-                        else:
-                            self.selected_process_index = 0
-                elif key == ord("k") or key == curses.KEY_UP:
-                    if self.show_overview:
-                        self.browse_sessions = True
-                        if self.selected_session_index > 0:
-                            self.selected_session_index -= 1
-                        elif self.sessions_data:
-                            self.selected_session_index = len(self.sessions_data) - 1
-                    elif (
-                        self.process_browsing_active and self.selected_process_index > 0
-                    ):
-                        self.selected_process_index -= 1
-                    elif self.process_browsing_active and self.windows_data:
-                        window = self.windows_data[self.current_tab]
-                        if window.processes:
-                            if self.selected_process_index > 0:
-                                self.selected_process_index -= 1
-                            else:
-                                self.selected_process_index = len(window.processes) - 1
-                elif key == ord("x") or key == ord("X"):
-                    if self.process_browsing_active:
-                        self.send_signal_to_process(15)  # SIGTERM
-                    elif (
-                        self.show_overview
-                        and self.browse_sessions
-                        and self.sessions_data
-                        and self.selected_session_index > 0
-                    ):
-                        self.selected_session_index -= 1
-                    elif self.show_overview:
-                        self.browse_sessions = True
-                        if self.sessions_data:
-                            self.selected_session_index = len(self.sessions_data) - 1
-                    else:
-                        self.prev_tab()
-                elif key == curses.KEY_RIGHT or key == ord("l") or key == ord("L"):
-                    if (
-                        self.show_overview
-                        and self.browse_sessions
-                        and self.sessions_data
-                        and self.selected_session_index < len(self.sessions_data) - 1
-                    ):
-                        self.selected_session_index += 1
-                    elif self.show_overview:
-                        self.browse_sessions = True
-                        if self.sessions_data:
-                            self.selected_session_index = 0
-                    else:
-                        self.next_tab()
+                                    process = window.processes[
+                                        self.selected_process_index
+                                    ]
+                                    command = process.command
+
+                                    tree_prefix = process.tree_prefix
+                                    base_line_len = len(process.base_line)
+                                    # Command starts after base_line + tree_prefix + 1 space
+                                    command_start = base_line_len + len(tree_prefix) + 1
+                                    width = self.screen_size[1]
+                                    max_cmd_len = width - command_start - 1
+
+                                    offset = self.horizontal_scroll_offset
+                                    if (
+                                        alt_key == curses.KEY_LEFT
+                                        or alt_key == ord("h")
+                                        or alt_key == ord("H")
+                                    ):
+                                        offset = max(0, offset - 10)
+                                    elif (
+                                        alt_key == curses.KEY_RIGHT
+                                        or alt_key == ord("l")
+                                        or alt_key == ord("L")
+                                    ):
+                                        max_offset = max(
+                                            0, len(command) - max_cmd_len + 4
+                                        )
+                                        offset = min(max_offset, offset + 10)
+
+                                    if offset != self.horizontal_scroll_offset:
+                                        self.horizontal_scroll_offset = offset
+                                    else:
+                                        # Already at the edge; nothing to redraw
+                                        self.needs_redraw = redraw_pending
+                            return True
+                        # If we get here, it was just ESC, fall through to ESC handler below
+
+                    # Normal mode or process browsing mode
+                    handler = self.key_handlers.get(key)
+                    if handler is not None:
+                        handler()
         except curses.error:
             pass
+        return key != -1
 
     def run_curses(self, stdscr):
         """Main curses loop."""
         self.stdscr = stdscr
         curses.curs_set(0)  # Hide cursor
+        if hasattr(curses, "set_escdelay"):  # Python 3.9+
+            curses.set_escdelay(ESCAPE_DELAY_MS)
         self.init_colors()
-
-        if self.show_overview:
-            stdscr.clear()
-            height, width = stdscr.getmaxyx()
-            loading_msg = "Loading system and tmux session data..."
-            stdscr.addstr(
-                height // 2,
-                (width - len(loading_msg)) // 2,
-                loading_msg,
-                curses.color_pair(3) | curses.A_BOLD,
-            )
-            stdscr.refresh()
-
-            self.collect_system_stats()
-
-            time.sleep(0.05)
-
-            last_refresh = time.time()
-
-            while self.running:
-                try:
-                    current_time = time.time()
-
-                    self.handle_input(stdscr)
-
-                    # Prioritize rendering
-                    try:
-                        height, width = stdscr.getmaxyx()
-                        stdscr.erase()
-
-                        self.draw_overview(stdscr, height, width)
-
-                        if not self.input_mode:
-                            curses.curs_set(0)
-                        footer = "Press 'q' to quit, 'j/k' or up/down to browse, Enter to select session"
-                        if width > len(footer):
-                            stdscr.addstr(height - 1, 0, footer, curses.color_pair(5))
-                        else:
-                            stdscr.addstr(
-                                height - 1,
-                                0,
-                                "q=quit j/k=browse Enter=select",
-                                curses.color_pair(5),
-                            )
-
-                        stdscr.refresh()
-                    except curses.error:
-                        pass
-
-                    # Collect data if needed
-                    if (
-                        not self.input_mode
-                        and current_time - last_refresh >= self.refresh_rate
-                    ):
-                        self.collect_system_stats()
-                        last_refresh = current_time
-
-                    time.sleep(0.033)
-
-                except KeyboardInterrupt:
-                    break
-            return
-
-        sessions = self.get_tmux_sessions()
-        if self.session_name not in sessions:
-            stdscr.clear()
-            error_msg = f"Error: Session '{self.session_name}' not found"
-            stdscr.addstr(0, 0, error_msg, curses.color_pair(4))
-            stdscr.addstr(2, 0, "Available sessions:", curses.color_pair(3))
-            for i, session in enumerate(sessions):
-                if i + 3 < curses.LINES:
+        self.screen_size = stdscr.getmaxyx()
+        # Take over SIGWINCH so a resize also wakes the blocking select()
+        signal.signal(signal.SIGWINCH, self.handle_resize_signal)
+        signal.set_wakeup_fd(self.wakeup_write)
+
+        if not self.show_overview:
+            sessions = self.get_tmux_sessions()
+            if self.session_name not in sessions:
+                stdscr.clear()
+                error_msg = f"Error: Session '{self.session_name}' not found"
+                stdscr.addstr(0, 0, error_msg, curses.color_pair(4))
+                stdscr.addstr(2, 0, "Available sessions:", curses.color_pair(3))
+                # Only list what fits above the exit prompt
+                visible = sessions[: max(0, curses.LINES - 6)]
+                for i, session in enumerate(visible):
                     stdscr.addstr(i + 3, 2, session)
-            stdscr.addstr(len(sessions) + 5, 0, "Press any key to exit...")
-            stdscr.refresh()
-            stdscr.getch()
-            return
+                stdscr.addstr(len(visible) + 5, 0, "Press any key to exit...")
+                stdscr.refresh()
+                stdscr.getch()
+                return
 
         stdscr.clear()
-        height, width = stdscr.getmaxyx()
-        loading_msg = "Loading tmux session data..."
-        stdscr.addstr(
-            height // 2,
-            (width - len(loading_msg)) // 2,
-            loading_msg,
-            curses.color_pair(3) | curses.A_BOLD,
+        height, width = self.screen_size
+        self.draw_loading(
+            stdscr,
+            height,
+            width,
+            (
+                "Loading system and tmux session data..."
+                if self.show_overview
+                else "Loading tmux session data..."
+            ),
         )
         stdscr.refresh()
 
-        self.collect_window_data()  # First pass - establishes baselines (returns 0%)
-        self.warmup_cpu_async()  # Background - re-samples after 100ms to update baselines
-        time.sleep(0.15)  # Wait for warmup to complete
-
-        last_refresh = 0
-
+        if self.show_overview:
+            # A shorter system CPU sample would be mostly noise
+            time.sleep(
+                max(0.0, self.cpu_primed_at + MIN_SAMPLE_INTERVAL - time.monotonic())
+            )
+            self.collect_system_stats()
+        else:
+            self.collect_window_data()  # First pass - establishes baselines (0%)
+            self.warmup_cpu_async()  # Background - re-samples after 100ms
+            self.cpu_warmup_done.wait(timeout=0.5)
+            # get_cpu_percent() ignores baselines younger than 0.1s, so let
+            # the warmup's age before the re-sample reads them
+            time.sleep(MIN_SAMPLE_INTERVAL)
+            # Data is collected in the background from here on, starting with
+            # a re-sample now that the warmup has set the CPU baselines
+            self.refresh_requested.set()
+            self.collector_wakeup.set()
+        self.start_collector()
+        stdscr.nodelay(True)
+
+        # Both modes share this loop, so switching modes only changes what the
+        # collector gathers and what is drawn from it
         while self.running:
             try:
-                current_time = time.time()
-
-                self.handle_input(stdscr)
+                self.wait_for_event()
+                if self.resized:
+                    self.apply_resize(stdscr)
+                had_input = False
+                while self.handle_input(stdscr):
+                    had_input = True
+                if had_input and not self.pane_visible:
+                    # Keys normally only reach a pane that is on screen
+                    self.recheck_pane_visibility()
+                elif had_input:
+                    # The keys may have lifted a pause or shortened a backed-off
+                    # interval, so let the collector re-plan its sleep
+                    self.collector_wakeup.set()
+                if not self.needs_redraw or not self.pane_visible:
+                    continue
+                if time.monotonic() - self.last_draw_time < self.frame_interval:
+                    continue
+                self.last_draw_time = time.monotonic()
+                self.needs_redraw = False
 
-                # Prioritize rendering - always render first
+                # Render the latest published data
                 try:
-                    height, width = stdscr.getmaxyx()
+                    height, width = self.screen_size
                     stdscr.erase()
 
-                    if self.show_overview:
-                        # Render overview mode
-                        self.draw_overview(stdscr, height, width)
-                        footer = "Press 'q' to quit, 'j/k' to browse, Enter to select session"
-                        if width > len(footer):
-                            stdscr.addstr(height - 1, 0, footer, curses.color_pair(5))
-                        else:
-                            stdscr.addstr(
-                                height - 1,
-                                0,
-                                "q=quit j/k=browse Enter=select",
-                                curses.color_pair(5),
+                    with self.data_lock:
+                        if self.show_help:
+                            self.draw_help(stdscr, height, width)
+                        elif not self.data_ready:
+                            self.draw_loading(
+                                stdscr,
+                                height,
+                                width,
+                                (
+                                    "Loading system and tmux session data..."
+                                    if self.show_overview
+                                    else "Loading tmux session data..."
+                                ),
                             )
-                    else:
-                        # Render session detail mode
-                        y_pos = self.draw_header(stdscr, height, width)
-                        y_pos = self.draw_tabs(stdscr, y_pos, height, width)
-                        self.draw_window_details(stdscr, y_pos, height, width)
-
-                        if self.input_mode == "signal":
-                            curses.curs_set(1)
-                            self.draw_input_prompt(stdscr, height, width)
+                        elif self.show_overview:
+                            # Render overview mode
+                            self.draw_overview(stdscr, height, width)
+                            self.draw_overview_footer(stdscr, height, width)
                         else:
-                            curses.curs_set(0)
-                            self.draw_footer(stdscr, height, width)
+                            # Render session detail mode
+                            y_pos = self.draw_header(stdscr, height, width)
+                            y_pos = self.draw_tabs(stdscr, y_pos, height, width)
+                            self.draw_window_details(stdscr, y_pos, height, width)
+
+                            if self.input_mode == "signal":
+                                curses.curs_set(1)
+                                self.draw_input_prompt(stdscr, height, width)
+                            else:
+                                curses.curs_set(0)
+                                self.draw_footer(stdscr, height, width)
 
-                    stdscr.refresh()
+                    stdscr.noutrefresh()
+                    curses.doupdate()
                 except curses.error:
                     pass
 
-                # Then collect data if needed (don't block rendering)
-                if (
-                    not self.input_mode
-                    and current_time - last_refresh >= self.refresh_rate
-                ):
-                    if self.show_overview:
-                        self.collect_system_stats()
-                    else:
-                        self.collect_window_data()
-                    last_refresh = current_time
-
-                # Minimal sleep to prevent CPU spin
-                time.sleep(0.033)  # ~30fps
-
             except KeyboardInterrupt:
                 break
 
@@ -1749,22 +2419,41 @@ class TmuxResourceMonitor:
         except KeyboardInterrupt:
             pass
         finally:
+            self.tmux_control.close()
+            self.proc_stats.close()
             print("Monitoring stopped.")
 
 
-def read_tmux_option(option, default=""):
-    """Read a tmux option value."""
+@functools.lru_cache(maxsize=None)
+def load_tmux_options():
+    """Read all global user options (@name) with a single tmux call."""
+    options = {}
     try:
         result = subprocess.run(
-            ["tmux", "show-option", "-gqv", f"@{option}"],
+            ["tmux", "show-options", "-g"],
             capture_output=True,
             text=True,
         )
-        if result.stdout and result.stdout.strip():
-            return result.stdout.strip()
-        return default
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return default
+    except FileNotFoundError:
+        return options
+
+    for line in result.stdout.splitlines():
+        if not line.startswith("@"):
+            continue
+        name, _, value = line.partition(" ")
+        # tmux quotes values containing spaces or special characters
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif len(value) >= 2 and value[0] == value[-1] == "'":
+            value = value[1:-1]
+        options[name[1:]] = value
+    return options
+
+
+def read_tmux_option(option, default=""):
+    """Read a tmux option value."""
+    value = load_tmux_options().get(option, "").strip()
+    return value if value else default
 
 
 def signal_handler(signum, frame):
@@ -1787,6 +2476,7 @@ Examples:
 
  Note: When used as a tmux plugin, options can also be set via .tmux.conf:
    set -g @tmux_resource_monitor_refresh_rate "2.0"
+   set -g @tmux_resource_monitor_max_fps "20"
    set -g @tmux_resource_monitor_width "80%%"
    set -g @tmux_resource_monitor_height "40%%"
 
@@ -1822,7 +2512,10 @@ Press '?' in the monitor for keyboard controls.
         "--refresh-rate",
         type=float,
         default=None,
-        help="Refresh rate in seconds (default: 2.0)",
+        help=(
+            f"Refresh rate in seconds (default: {DEFAULT_REFRESH_RATE}, "
+            f"minimum: {MIN_SAMPLE_INTERVAL})"
+        ),
     )
 
     parser.add_argument(
@@ -1854,13 +2547,10 @@ Press '?' in the monitor for keyboard controls.
                 text=True,
                 check=True,
             )
-            sessions = (
-                result.stdout.strip().split("\n") if result.stdout.strip() else []
-            )
+            sessions = result.stdout.splitlines()
             if sessions:
                 print("Available tmux sessions:")
-                for session in sessions:
-                    print(f"  {session}")
+                sys.stdout.write("".join(f"  {session}\n" for session in sessions))
             else:
                 print("No tmux sessions found")
         except subprocess.CalledProcessError:
@@ -1869,23 +2559,35 @@ Press '?' in the monitor for keyboard controls.
 
     refresh_rate = args.refresh_rate
     if refresh_rate is None:
-        refresh_rate_str = read_tmux_option("tmux_resource_monitor_refresh_rate")
-        if not refresh_rate_str:
-            refresh_rate_str = "2.0"
         try:
-            refresh_rate = float(refresh_rate_str)
+            refresh_rate = float(
+                read_tmux_option("tmux_resource_monitor_refresh_rate")
+                or DEFAULT_REFRESH_RATE
+            )
         except ValueError:
-            refresh_rate = 2.0
+            refresh_rate = DEFAULT_REFRESH_RATE
 
     if refresh_rate <= 0:
         print("Error: Refresh rate must be positive")
         sys.exit(1)
 
+    try:
+        max_fps = float(
+            read_tmux_option("tmux_resource_monitor_max_fps") or DEFAULT_MAX_FPS
+        )
+    except ValueError:
+        max_fps = DEFAULT_MAX_FPS
+    if max_fps <= 0:
+        max_fps = DEFAULT_MAX_FPS
+
     show_overview = args.overview
 
     if show_overview:
         monitor = TmuxResourceMonitor(
-            session_name=None, window_filter=None, refresh_rate=refresh_rate
+            session_name=None,
+            window_filter=None,
+            refresh_rate=refresh_rate,
+            max_fps=max_fps,
         )
         monitor.show_overview = True
         monitor.run()
@@ -1902,7 +2604,7 @@ Press '?' in the monitor for keyboard controls.
     else:
         window_filter = args.window_filter
 
-    monitor = TmuxResourceMonitor(session_name, window_filter, refresh_rate)
+    monitor = TmuxResourceMonitor(session_name, window_filter, refresh_rate, max_fps)
 
     monitor.run()
 
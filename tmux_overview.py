@@ -5,12 +5,36 @@ tmux-resource-monitor-overview.py - System-wide tmux resource overview using ncu
 
 import argparse
 import curses
+import os
+import selectors
+import signal
 import subprocess
+import sys
+import threading
 import time
 from dataclasses import dataclass
 from typing import List
 import psutil
 
+from tmux_monitor import (
+    DEFAULT_REFRESH_RATE,
+    MIN_SAMPLE_INTERVAL,
+    ProcStatReader,
+    TmuxControlClient,
+)
+
+# Sessions are swept on every this-many-th refresh; the system CPU and memory
+# figures are cheap and refresh every time
+DEFAULT_SESSION_REFRESH_MULTIPLIER = 3
+
+# Shortest time between two redraws; the main loop otherwise sleeps until a
+# key, new data or a resize arrives
+FRAME_INTERVAL = 0.05
+
+# Footer key hints, with a short form for narrow terminals
+FOOTER = "q=quit | j/k or up/down=browse | Enter=view session"
+FOOTER_SHORT = "q=quit j/k=browse Enter=view"
+
 
 @dataclass
 class SessionStats:
@@ -19,15 +43,38 @@ class SessionStats:
     ram_total: int
     process_count: int
     window_count: int
+    row: str = ""  # Formatted table row, built once per collection
 
 
 class TmuxOverviewMonitor:
-    def __init__(self, refresh_rate=2.0):
-        self.refresh_rate = refresh_rate
+    def __init__(
+        self,
+        refresh_rate=DEFAULT_REFRESH_RATE,
+        session_refresh_multiplier=DEFAULT_SESSION_REFRESH_MULTIPLIER,
+    ):
+        self.refresh_rate = max(refresh_rate, MIN_SAMPLE_INTERVAL)
+        self.session_refresh_multiplier = session_refresh_multiplier
         self.total_ram_mb = psutil.virtual_memory().total // (1024 * 1024)
+        # The first cpu_percent() call in a thread only sets psutil's baseline
+        # for that thread and returns 0.0, so make it here; run_curses waits
+        # out MIN_SAMPLE_INTERVAL from this point before its first collection
+        psutil.cpu_percent()
+        self.cpu_primed_at = time.monotonic()
         self.running = True
         self.stdscr = None
         self.colors_initialized = False
+        self.needs_redraw = True  # Set by new data or input, cleared once drawn
+        self.screen_size = (0, 0)  # (height, width), updated on resize
+        self.resized = False  # Set by the SIGWINCH handler
+        # Self-pipe that wakes the main loop for redraws and signals
+        self.wakeup_read, self.wakeup_write = os.pipe()
+        os.set_blocking(self.wakeup_read, False)
+        os.set_blocking(self.wakeup_write, False)
+        self.data_lock = threading.Lock()  # Guards data published by the collector
+        self.row_colors = (0, 0, 0)  # (selected, high CPU, normal), set in init_colors
+        self.footer_color = 0
+        self.title_color = 0  # Titles, column headers and prompts
+        self.separator_color = 0  # Separator lines and delimiters
         self.browse_sessions = False
         self.selected_session_index = 0
         self.sessions_data: List[SessionStats] = []
@@ -37,62 +84,87 @@ class TmuxOverviewMonitor:
         self.tmux_cpu_percent = 0.0
         self.tmux_memory_mb = 0
         self.tmux_memory_percent = 0.0
-        self.cpu_warmup_done = False
-        self.last_cpu_measurements = {}
-
-    def warmup_cpu_async(self):
-        """Start async CPU warmup in background to establish baseline."""
-        import threading
-        def do_warmup():
-            time.sleep(0.1)
-            sessions = self.get_tmux_sessions()
-            for session_name in sessions:
-                pane_pids = self.get_session_pane_pids(session_name)
-                for pid in pane_pids:
-                    try:
-                        proc = psutil.Process(pid)
-                        times = proc.cpu_times()
-                        self.last_cpu_measurements[pid] = (time.time(), times)
-                        for child in proc.children(recursive=True):
-                            try:
-                                child_times = child.cpu_times()
-                                self.last_cpu_measurements[child.pid] = (time.time(), child_times)
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                pass
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        if pid in self.last_cpu_measurements:
-                            del self.last_cpu_measurements[pid]
-            self.cpu_warmup_done = True
-        thread = threading.Thread(target=do_warmup, daemon=True)
-        thread.start()
+        self.last_snapshot = None  # Values drawn from the latest collection
+        self.last_cpu_seconds = {}  # pid -> CPU seconds at the previous collection
+        self.last_sample_time = float("-inf")
+        self.proc_cache = {}  # pid -> psutil.Process from the latest process sweep
+        self.proc_stats = ProcStatReader()
+        self.tmux_control = TmuxControlClient()
+
+        # Key handlers, looked up by key code
+        self.key_handlers = {}
+        for keys, handler in (
+            ((ord("q"), ord("Q"), 3, 27), self.quit),  # 3 is Ctrl+C, 27 is ESC
+            ((ord("j"), curses.KEY_DOWN), self.select_next),
+            ((ord("k"), curses.KEY_UP), self.select_previous),
+            ((10, 13), self.open_selected_session),  # Enter
+        ):
+            for key in keys:
+                self.key_handlers[key] = handler
+
+    def scan_processes(self):
+        """Map each PID to its child PIDs with a single sweep of all processes."""
+        ppids = self.proc_stats.ppids()
+        if ppids is None:
+            # process_iter() hands out the same Process for a PID on every sweep
+            # and replaces it when the PID is reused, so exited PIDs just drop out
+            ppids = {}
+            proc_cache = {}
+            for proc in psutil.process_iter(["ppid"]):
+                proc_cache[proc.pid] = proc
+                ppids[proc.pid] = proc.info["ppid"]
+            self.proc_cache = proc_cache
+        else:
+            self.proc_stats.prune(ppids)
+
+        children_map = {}
+        for pid, ppid in ppids.items():
+            if ppid is not None:
+                children_map.setdefault(ppid, []).append(pid)
+        return children_map
+
+    def read_process_stats(self, pids):
+        """Return {pid: (cpu_seconds, rss_kb)} for the PIDs that could be read.
+
+        On Linux these come straight from /proc/<pid>/stat and statm, which
+        only the tmux processes need; elsewhere psutil reads them.
+        """
+        stats = self.proc_stats.read(pids)
+        if stats is not None:
+            return {pid: stat[:2] for pid, stat in stats.items()}
 
-    def get_cpu_percent(self, pid, update_baseline=False):
-        """Get CPU percent using cpu_times() for accurate measurements."""
-        try:
+        stats = {}
+        for pid in pids:
+            try:
+                proc = self._proc(pid)
+                with proc.oneshot():
+                    cpu_times = proc.cpu_times()
+                    rss_kb = proc.memory_info().rss // 1024
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            stats[pid] = (cpu_times.user + cpu_times.system, rss_kb)
+        return stats
+
+    def _proc(self, pid):
+        """Get the Process from the latest sweep, or a new one if it is missing."""
+        proc = self.proc_cache.get(pid)
+        if proc is None:
             proc = psutil.Process(pid)
-            current_times = proc.cpu_times()
-            current_time = time.time()
-
-            if pid in self.last_cpu_measurements:
-                last_time, last_times = self.last_cpu_measurements[pid]
-                elapsed = current_time - last_time
-
-                if elapsed > 0.1:
-                    last_cpu = last_times.user + last_times.system
-                    current_cpu = current_times.user + current_times.system
-                    cpu_diff = current_cpu - last_cpu
-                    percent = (cpu_diff / elapsed) * 100
-                    if update_baseline:
-                        self.last_cpu_measurements[pid] = (current_time, current_times)
-                    return percent
-                else:
-                    return 0.0
-
-            if update_baseline:
-                self.last_cpu_measurements[pid] = (current_time, current_times)
-            return 0.0
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            return 0.0
+        return proc
+
+    def get_descendants(self, pid, children_map):
+        """Get all descendant PIDs of a process from a prebuilt children map."""
+        descendants = []
+        seen = {pid}
+        stack = list(children_map.get(pid, ()))
+        while stack:
+            child_pid = stack.pop()
+            if child_pid in seen:
+                continue
+            seen.add(child_pid)
+            descendants.append(child_pid)
+            stack.extend(children_map.get(child_pid, ()))
+        return descendants
 
     def init_colors(self):
         """Initialize color pairs for curses."""
@@ -111,133 +183,201 @@ class TmuxOverviewMonitor:
 
             self.colors_initialized = True
 
-    def get_tmux_sessions(self):
-        """Get list of available tmux sessions."""
+        # Session row attributes, looked up once instead of per row
+        self.row_colors = (
+            curses.color_pair(1) | curses.A_REVERSE,
+            curses.color_pair(4),
+            curses.color_pair(0),
+        )
+        self.footer_color = curses.color_pair(5)
+        self.title_color = curses.color_pair(3) | curses.A_BOLD
+        self.separator_color = curses.color_pair(5)
+
+    def tmux_output(self, args):
+        """Run a tmux command over the control-mode connection, or directly."""
+        if not any("'" in arg for arg in args):
+            lines = self.tmux_control.command(" ".join(f"'{arg}'" for arg in args))
+            if lines is not None:
+                return lines
         try:
-            result = subprocess.run(
-                ["tmux", "list-sessions", "-F", "#{session_name}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            return result.stdout.strip().split("\n") if result.stdout.strip() else []
+            # Descriptors Python opens are not inheritable, so none need closing
+            result = subprocess.run(["tmux"] + args, capture_output=True, text=True, check=True, close_fds=False)
+            return result.stdout.splitlines()
         except subprocess.CalledProcessError:
             return []
 
-    def get_session_window_count(self, session_name):
-        """Get the number of windows in a session."""
-        try:
-            result = subprocess.run(
-                ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            windows = result.stdout.strip().split("\n") if result.stdout.strip() else []
-            return len([w for w in windows if w])
-        except subprocess.CalledProcessError:
-            return 0
+    def snapshot_tmux(self):
+        """Get {session: {window_index: [pane_pid, ...]}} with one tmux query."""
+        snapshot = {}
+        lines = self.tmux_output(["list-panes", "-a", "-F", "#{session_name}\t#{window_index}\t#{pane_pid}"])
+        for line in lines:
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            session_name, window_index, pane_pid = parts
+            try:
+                pane_pid = int(pane_pid)
+            except ValueError:
+                continue
+            snapshot.setdefault(session_name, {}).setdefault(window_index, []).append(pane_pid)
+        return snapshot
 
-    def get_session_pane_pids(self, session_name):
-        """Get all pane PIDs for a session."""
-        pids = []
-        try:
-            windows_result = subprocess.run(
-                ["tmux", "list-windows", "-t", session_name, "-F", "#{window_index}"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            for window_idx in windows_result.stdout.strip().split("\n"):
-                if not window_idx:
-                    continue
-                try:
-                    panes_result = subprocess.run(
-                        ["tmux", "list-panes", "-t", f"{session_name}:{window_idx}", "-F", "#{pane_pid}"],
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-                    for pid_str in panes_result.stdout.strip().split("\n"):
-                        if pid_str.strip():
-                            try:
-                                pids.append(int(pid_str.strip()))
-                            except ValueError:
-                                continue
-                except subprocess.CalledProcessError:
-                    continue
-        except subprocess.CalledProcessError:
-            pass
-        return pids
+    def pane_pids(self, windows):
+        """Get all pane PIDs from a session's {window_index: [pane_pid, ...]}."""
+        return [pid for pane_pids in windows.values() for pid in pane_pids]
 
     def collect_all_sessions_stats(self):
-        """Collect stats for all tmux sessions."""
-        sessions = self.get_tmux_sessions()
-        self.sessions_data = []
+        """Collect stats for all tmux sessions, busiest first.
 
-        for session_name in sessions:
-            try:
-                pane_pids = self.get_session_pane_pids(session_name)
-                window_count = self.get_session_window_count(session_name)
+        Sessions, window counts and pane PIDs all come from one tmux snapshot.
+        """
+        sessions_data = []
+        children_map = self.scan_processes()
+
+        # Only processes inside tmux panes are read, all in one pass
+        session_pids = {}
+        for session_name, windows in self.snapshot_tmux().items():
+            pids = []
+            for pid in self.pane_pids(windows):
+                pids.append(pid)
+                pids.extend(self.get_descendants(pid, children_map))
+            session_pids[session_name] = (pids, len(windows))
+        proc_stats = self.read_process_stats(
+            [pid for pids, _ in session_pids.values() for pid in pids]
+        )
 
+        # CPU percent is the CPU time used since the previous collection; PIDs
+        # missing from it start at 0% and exited PIDs drop out with the old map
+        current_time = time.monotonic()
+        elapsed = current_time - self.last_sample_time
+        last_cpu_seconds = self.last_cpu_seconds
+        cpu_seconds_by_pid = {}
+
+        for session_name, (pids, window_count) in session_pids.items():
+            try:
                 session_cpu = 0.0
                 session_ram = 0
                 session_process_count = 0
 
-                for pid in pane_pids:
-                    try:
-                        proc = psutil.Process(pid)
-                        session_cpu += self.get_cpu_percent(pid)
-                        session_ram += proc.memory_info().rss // 1024
-                        session_process_count += 1
-                        for child in proc.children(recursive=True):
-                            try:
-                                session_cpu += self.get_cpu_percent(child.pid)
-                                session_ram += child.memory_info().rss // 1024
-                                session_process_count += 1
-                            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                                continue
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
-
-                self.sessions_data.append(SessionStats(
+                for p in pids:
+                    if p not in proc_stats:
+                        continue  # Exited or not readable
+                    cpu_seconds, rss_kb = proc_stats[p]
+                    cpu_seconds_by_pid[p] = cpu_seconds
+                    last_cpu = last_cpu_seconds.get(p)
+                    if last_cpu is not None:
+                        session_cpu += (cpu_seconds - last_cpu) / elapsed * 100
+                    session_ram += rss_kb
+                    session_process_count += 1
+
+                ram_percent = (session_ram * 100) / (self.total_ram_mb * 1024) if self.total_ram_mb > 0 else 0
+                sessions_data.append(SessionStats(
                     name=session_name,
                     cpu_total=session_cpu,
                     ram_total=session_ram,
                     process_count=session_process_count,
-                    window_count=window_count
+                    window_count=window_count,
+                    row=f"{session_name[:19]:<20} {session_cpu:>7.1f}% {session_ram // 1024:>6d}MB({ram_percent:>4.1f}%) {session_process_count:>7} {window_count:>6}",
                 ))
             except Exception:
                 continue
 
-        self.sessions_data.sort(key=lambda x: x.cpu_total, reverse=True)
+        self.last_cpu_seconds = cpu_seconds_by_pid
+        self.last_sample_time = current_time
+        sessions_data.sort(key=lambda x: x.cpu_total, reverse=True)
+        return sessions_data
+
+    def collect_system_stats(self, include_sessions=True):
+        """Collect system-wide resource usage.
 
-    def collect_system_stats(self):
-        """Collect system-wide resource usage."""
+        The tmux sessions are only swept again when include_sessions is set;
+        otherwise their previous stats are kept. Returns False when every
+        value on screen is unchanged since the previous pass, so the frame
+        does not need redrawing.
+        """
         try:
-            self.system_cpu_percent = psutil.cpu_percent()
+            system_cpu_percent = psutil.cpu_percent()
             mem = psutil.virtual_memory()
-            self.system_memory_percent = mem.percent
-            self.system_memory_mb = mem.used // (1024 * 1024)
+            system_memory_percent = mem.percent
+            system_memory_mb = mem.used // (1024 * 1024)
         except Exception:
-            self.system_cpu_percent = 0.0
-            self.system_memory_percent = 0.0
-            self.system_memory_mb = 0
+            system_cpu_percent = 0.0
+            system_memory_percent = 0.0
+            system_memory_mb = 0
 
-        self.collect_all_sessions_stats()
+        if include_sessions:
+            sessions_data = self.collect_all_sessions_stats()
+        else:
+            sessions_data = self.sessions_data  # Only this thread replaces it
 
         total_tmux_cpu = 0.0
         total_tmux_ram = 0
-        for session in self.sessions_data:
+        for session in sessions_data:
             total_tmux_cpu += session.cpu_total
             total_tmux_ram += session.ram_total
 
-        self.tmux_cpu_percent = total_tmux_cpu
-        self.tmux_memory_mb = total_tmux_ram // 1024
-        self.tmux_memory_percent = (
-            (total_tmux_ram * 100) / (self.total_ram_mb * 1024)
-            if self.total_ram_mb > 0 else 0
-        )
+        # Publish everything at once so a frame never mixes old and new data
+        with self.data_lock:
+            self.system_cpu_percent = system_cpu_percent
+            self.system_memory_percent = system_memory_percent
+            self.system_memory_mb = system_memory_mb
+            self.sessions_data = sessions_data
+            self.tmux_cpu_percent = total_tmux_cpu
+            self.tmux_memory_mb = total_tmux_ram // 1024
+            self.tmux_memory_percent = (
+                (total_tmux_ram * 100) / (self.total_ram_mb * 1024)
+                if self.total_ram_mb > 0 else 0
+            )
+
+        snapshot = (system_cpu_percent, system_memory_percent, system_memory_mb, sessions_data)
+        changed = snapshot != self.last_snapshot
+        self.last_snapshot = snapshot
+        return changed
+
+    def collector_loop(self):
+        """Collect data in the background so input and rendering never block."""
+        # The first pass in run_curses set the CPU baselines, so the next one
+        # only waits long enough for the percentages to mean something.
+        # psutil keeps the system baseline per thread, so set this thread's too
+        psutil.cpu_percent()
+        time.sleep(MIN_SAMPLE_INTERVAL)
+        refresh_count = 0
+        while self.running:
+            # Intervals run from the start of a collection so its cost adds no drift
+            started = time.monotonic()
+            include_sessions = refresh_count % self.session_refresh_multiplier == 0
+            refresh_count += 1
+            if self.collect_system_stats(include_sessions):
+                self.request_redraw()
+            time.sleep(max(0.0, started + self.refresh_rate - time.monotonic()))
+
+    def request_redraw(self):
+        """Mark the screen stale and wake the main loop to redraw it."""
+        self.needs_redraw = True
+        try:
+            os.write(self.wakeup_write, b"\0")
+        except BlockingIOError:
+            pass  # The pipe is full, so a wakeup is already pending
+
+    def handle_resize_signal(self, signum, frame):
+        """Note a terminal resize; the main loop applies it after waking."""
+        self.resized = True
+
+    def apply_resize(self, stdscr):
+        """Resize curses to the terminal's new size and schedule a redraw."""
+        self.resized = False
+        try:
+            size = os.get_terminal_size(sys.__stdout__.fileno())
+            curses.resizeterm(size.lines, size.columns)
+        except (OSError, curses.error):
+            pass
+        self.screen_size = stdscr.getmaxyx()
+        self.needs_redraw = True
+
+    def start_collector(self):
+        """Start the background data collector thread."""
+        thread = threading.Thread(target=self.collector_loop, daemon=True)
+        thread.start()
 
     def draw(self, stdscr, height, width):
         """Draw the overview screen."""
@@ -245,7 +385,7 @@ class TmuxOverviewMonitor:
 
         title = "System Resource Overview"
         x_pos = max(0, (width - len(title)) // 2)
-        stdscr.addstr(y_pos, x_pos, title, curses.color_pair(3) | curses.A_BOLD)
+        stdscr.addstr(y_pos, x_pos, title, self.title_color)
         y_pos += 2
 
         stdscr.addstr(y_pos, 7, "CPU", curses.color_pair(7))
@@ -263,14 +403,14 @@ class TmuxOverviewMonitor:
         y_pos += 2
 
         separator = "-" * (width - 1)
-        stdscr.addstr(y_pos, 0, separator, curses.color_pair(5))
+        stdscr.addstr(y_pos, 0, separator, self.separator_color)
         y_pos += 1
 
         header = f"{'Session':<20} {'CPU%':>8} {'MEM':>12} {'Procs':>7} {'Wins':>6}"
-        stdscr.addstr(y_pos, 0, header, curses.color_pair(3) | curses.A_BOLD)
+        stdscr.addstr(y_pos, 0, header, self.title_color)
         y_pos += 1
 
-        stdscr.addstr(y_pos, 0, separator, curses.color_pair(5))
+        stdscr.addstr(y_pos, 0, separator, self.separator_color)
         y_pos += 1
 
         if not self.sessions_data:
@@ -285,133 +425,151 @@ class TmuxOverviewMonitor:
             self.selected_session_index = len(self.sessions_data) - 1
 
         available_lines = height - y_pos - 2
+        selected_color, high_cpu_color, normal_color = self.row_colors
         first_displayed = 0
         if self.browse_sessions and self.sessions_data:
             if self.selected_session_index >= available_lines:
                 first_displayed = self.selected_session_index - available_lines + 1
 
-        for idx, session in enumerate(self.sessions_data):
-            line_idx = idx - first_displayed
-            if line_idx < 0:
-                continue
-            if line_idx >= available_lines:
-                break
-
+        # Only the rows that fit are visited, each cut to the usable width
+        usable_width = width - 1
+        visible_sessions = self.sessions_data[first_displayed:first_displayed + max(0, available_lines)]
+        for line_idx, session in enumerate(visible_sessions):
+            idx = first_displayed + line_idx
             current_y = y_pos + line_idx
-
-            ram_mb = session.ram_total // 1024
-            ram_percent = (session.ram_total * 100) / (self.total_ram_mb * 1024) if self.total_ram_mb > 0 else 0
-
             is_selected = self.browse_sessions and idx == self.selected_session_index
 
-            row = f"{session.name[:19]:<20} {session.cpu_total:>7.1f}% {ram_mb:>6d}MB({ram_percent:>4.1f}%) {session.process_count:>7} {session.window_count:>6}"
-
             if is_selected:
-                color = curses.color_pair(1) | curses.A_REVERSE
+                color = selected_color
             elif session.cpu_total > 10:
-                color = curses.color_pair(4)
+                color = high_cpu_color
             else:
-                color = curses.color_pair(0)
+                color = normal_color
 
             try:
-                stdscr.addstr(current_y, 0, row[:width-1], color)
+                stdscr.addstr(current_y, 0, session.row[:usable_width], color)
             except curses.error:
                 pass
 
     def handle_input(self, stdscr):
-        """Handle keyboard input."""
-        stdscr.nodelay(True)
-
+        """Handle one queued keypress; return False once no key is pending."""
         try:
             key = stdscr.getch()
             if key == -1:
-                return
-
-            if key == ord("q") or key == ord("Q"):
-                self.running = False
-            elif key == 3:
-                self.running = False
-            elif key == ord("j") or key == curses.KEY_DOWN:
-                self.browse_sessions = True
-                if self.selected_session_index < len(self.sessions_data) - 1:
-                    self.selected_session_index += 1
-                else:
-                    self.selected_session_index = 0
-            elif key == ord("k") or key == curses.KEY_UP:
-                self.browse_sessions = True
-                if self.selected_session_index > 0:
-                    self.selected_session_index -= 1
-                elif self.sessions_data:
-                    self.selected_session_index = len(self.sessions_data) - 1
-            elif key == 10 or key == 13:
-                if self.sessions_data and self.selected_session_index < len(self.sessions_data):
-                    selected = self.sessions_data[self.selected_session_index]
-                    self.running = False
-                    import os
-                    os.execv("/usr/bin/python3", ["python3", f"{os.path.dirname(os.path.abspath(__file__))}/tmux_monitor.py", selected.name])
-            elif key == 27:
-                self.running = False
+                return False
+            self.needs_redraw = True
+            if key == curses.KEY_RESIZE:
+                self.screen_size = stdscr.getmaxyx()
+
+            handler = self.key_handlers.get(key)
+            if handler is not None:
+                handler()
 
         except curses.error:
             pass
+        return True
+
+    def quit(self):
+        """Stop the main loop."""
+        self.running = False
+
+    def select_next(self):
+        """Move the session selection down, wrapping at the end."""
+        self.browse_sessions = True
+        if self.selected_session_index < len(self.sessions_data) - 1:
+            self.selected_session_index += 1
+        else:
+            self.selected_session_index = 0
+
+    def select_previous(self):
+        """Move the session selection up, wrapping at the start."""
+        self.browse_sessions = True
+        if self.selected_session_index > 0:
+            self.selected_session_index -= 1
+        elif self.sessions_data:
+            self.selected_session_index = len(self.sessions_data) - 1
+
+    def open_selected_session(self):
+        """Replace the overview with the session monitor for the selected session."""
+        if self.sessions_data and self.selected_session_index < len(self.sessions_data):
+            selected = self.sessions_data[self.selected_session_index]
+            self.running = False
+            os.execv("/usr/bin/python3", ["python3", f"{os.path.dirname(os.path.abspath(__file__))}/tmux_monitor.py", selected.name])
 
     def run_curses(self, stdscr):
         """Main curses loop."""
         self.stdscr = stdscr
         curses.curs_set(0)
+        # The cursor stays hidden, so curses need not move it back after updates
+        stdscr.leaveok(True)
         self.init_colors()
 
         stdscr.clear()
-        height, width = stdscr.getmaxyx()
+        self.screen_size = stdscr.getmaxyx()
+        height, width = self.screen_size
         loading_msg = "Loading system and tmux session data..."
         stdscr.addstr(
             height // 2,
             (width - len(loading_msg)) // 2,
             loading_msg,
-            curses.color_pair(3) | curses.A_BOLD,
+            self.title_color,
         )
         stdscr.refresh()
 
-        self.collect_system_stats()
-        self.warmup_cpu_async()
-        time.sleep(0.15)
+        # A shorter system CPU sample would be mostly noise
+        time.sleep(max(0.0, self.cpu_primed_at + MIN_SAMPLE_INTERVAL - time.monotonic()))
+        self.collect_system_stats()  # First pass - establishes process CPU baselines
+        self.start_collector()
 
-        last_refresh = 0
+        # Take over SIGWINCH so a resize also wakes the blocking select()
+        signal.signal(signal.SIGWINCH, self.handle_resize_signal)
+        signal.set_wakeup_fd(self.wakeup_write)
 
-        last_draw = 0
+        # Sleep until a key, new data or a signal arrives instead of polling
+        selector = selectors.DefaultSelector()
+        selector.register(sys.stdin, selectors.EVENT_READ)
+        selector.register(self.wakeup_read, selectors.EVENT_READ)
+        stdscr.nodelay(True)
+        last_draw = float("-inf")
 
         while self.running:
             try:
-                current_time = time.time()
-
-                self.handle_input(stdscr)
-
-                if current_time - last_refresh >= self.refresh_rate:
-                    self.collect_system_stats()
-                    last_refresh = current_time
-
-                redraw_interval = 0.05 if current_time - last_refresh < 2 else 0.1
-                if current_time - last_draw >= redraw_interval:
+                # A pending redraw only waits out the rest of the frame interval
+                timeout = None
+                if self.needs_redraw:
+                    timeout = max(0.0, last_draw + FRAME_INTERVAL - time.monotonic())
+                for key, _ in selector.select(timeout):
+                    if key.fileobj == self.wakeup_read:
+                        try:
+                            os.read(self.wakeup_read, 4096)
+                        except BlockingIOError:
+                            pass
+
+                if self.resized:
+                    self.apply_resize(stdscr)
+                while self.running and self.handle_input(stdscr):
+                    pass
+
+                # Repaint only for new data or input, at most once per frame
+                # interval; an unchanged frame would write the same screen again
+                if self.needs_redraw and time.monotonic() - last_draw >= FRAME_INTERVAL:
+                    last_draw = time.monotonic()
+                    self.needs_redraw = False
                     try:
-                        height, width = stdscr.getmaxyx()
+                        height, width = self.screen_size
                         stdscr.erase()
-                        self.draw(stdscr, height, width)
+                        with self.data_lock:
+                            self.draw(stdscr, height, width)
 
-                        curses.curs_set(0)
-                        footer = "q=quit | j/k or up/down=browse | Enter=view session"
-                        if width > len(footer):
-                            stdscr.addstr(height - 1, 0, footer, curses.color_pair(5))
-                        else:
-                            stdscr.addstr(height - 1, 0, "q=quit j/k=browse Enter=view", curses.color_pair(5))
+                        footer = FOOTER if width > len(FOOTER) else FOOTER_SHORT
+                        stdscr.addstr(height - 1, 0, footer, self.footer_color)
 
-                        stdscr.refresh()
-                        last_draw = current_time
+                        stdscr.noutrefresh()
+                        curses.doupdate()
 
                     except curses.error:
-                        time.sleep(0.1)
-                        continue
-
-                time.sleep(0.05)
+                        # Too small to draw; the resize that fixes it redraws
+                        pass
 
             except KeyboardInterrupt:
                 break
@@ -423,6 +581,8 @@ class TmuxOverviewMonitor:
         except KeyboardInterrupt:
             pass
         finally:
+            self.tmux_control.close()
+            self.proc_stats.close()
             print("Overview stopped.")
 
 
@@ -434,6 +594,7 @@ def main():
 Examples:
   %(prog)s                    # Run overview with default settings
   %(prog)s -r 1.0             # Refresh every 1 second
+  %(prog)s -r 1.0 -s 5        # System figures every second, sessions every 5
 
 Press '?' in the monitor for keyboard controls.
         """
@@ -443,8 +604,16 @@ Press '?' in the monitor for keyboard controls.
         "-r",
         "--refresh-rate",
         type=float,
-        default=2.0,
-        help="Refresh rate in seconds (default: 2.0)",
+        default=DEFAULT_REFRESH_RATE,
+        help=f"Refresh rate in seconds (default: {DEFAULT_REFRESH_RATE}, minimum: {MIN_SAMPLE_INTERVAL})",
+    )
+
+    parser.add_argument(
+        "-s",
+        "--session-refresh-multiplier",
+        type=int,
+        default=DEFAULT_SESSION_REFRESH_MULTIPLIER,
+        help=f"Sweep tmux sessions on every Nth refresh (default: {DEFAULT_SESSION_REFRESH_MULTIPLIER})",
     )
 
     args = parser.parse_args()
@@ -452,8 +621,14 @@ Press '?' in the monitor for keyboard controls.
     if args.refresh_rate <= 0:
         print("Error: Refresh rate must be positive")
         return
+    if args.session_refresh_multiplier < 1:
+        print("Error: Session refresh multiplier must be at least 1")
+        return
 
-    monitor = TmuxOverviewMonitor(refresh_rate=args.refresh_rate)
+    monitor = TmuxOverviewMonitor(
+        refresh_rate=args.refresh_rate,
+        session_refresh_multiplier=args.session_refresh_multiplier,
+    )
     monitor.run()
 
 